@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos PDFs de bônus - TribeBuild
+
+Gera cada documento várias vezes no mesmo processo (em memória, sem disco)
+no modo normal e no modo acessível e mostra a mediana dos tempos de layout,
+de gravação e total, o tamanho do arquivo e o custo extra do modo acessível.
+A primeira renderização de cada combinação é de aquecimento (estilos,
+fontes, imagens e caches) e fica fora das medições. Os dois modos são
+gerados alternados, então variações da máquina durante a medição atingem
+os dois; o custo extra é a mediana das razões entre renders vizinhos. Se
+algum documento passar de --max-overhead (padrão 35% do tempo total) o
+benchmark sai com erro.
+
+Com --workers N mede a memória por worker de um pool de N processos:
+workers criados por spawn (cada um monta estilos, fontes e caches) contra
+os pré-fork de create_pool (estado preparado no processo principal e
+compartilhado). USS é a memória só do worker; PSS divide as páginas
+compartilhadas entre os processos que as usam. Só no Linux.
+
+Com --check gera cada documento duas vezes no mesmo processo, em todos os
+locales e nos dois modos, e compara as páginas: os caches de parágrafos e
+imagens não podem mudar o layout da segunda geração em diante. Também
+confere a atualização incremental (bonus_diff): depois de uma edição (o
+nome do aluno na capa), o PDF anterior + a atualização precisa abrir no
+pypdf em modo estrito, se instalado, e ter as mesmas páginas do documento
+gerado do zero.
+
+Uso: python scripts/bench_bonus_pdfs.py --runs 10 --locale en
+     python scripts/bench_bonus_pdfs.py --max-overhead 25
+     python scripts/bench_bonus_pdfs.py --workers 4
+     python scripts/bench_bonus_pdfs.py --check
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from io import BytesIO
+
+from bonus_diff import PDFFile, diff_pages, incremental_update
+from bonus_locales import DEFAULT_LOCALE, LOCALES
+from create_bonus_pdfs import DOCUMENTS, create_pool, write_document
+
+MODES = {'normal': False, 'acessível': True}
+
+# Custo extra máximo do modo acessível (% do tempo total de layout + gravação)
+MAX_OVERHEAD = 35
+
+
+def summarize(samples):
+    """Mediana de layout, gravação e total (segundos) e tamanho do PDF em bytes"""
+    layout = statistics.median(m['layout_seconds'] for m in samples)
+    write = statistics.median(m['write_seconds'] for m in samples)
+    total = statistics.median(m['layout_seconds'] + m['write_seconds'] for m in samples)
+    return {'layout': layout, 'write': write, 'total': total, 'bytes': samples[-1]['bytes'],
+            'pages': samples[-1]['pages']}
+
+
+def measure(doc_id, locale, logo, runs):
+    """Mede os dois modos alternados (normal, acessível, acessível, normal...)"""
+    samples = {mode: [] for mode in MODES}
+    for accessible in MODES.values():
+        write_document(BytesIO(), doc_id, locale, logo, accessible=accessible)
+    for index in range(runs):
+        order = list(MODES.items())
+        for mode, accessible in order if index % 2 == 0 else reversed(order):
+            samples[mode].append(write_document(BytesIO(), doc_id, locale, logo, accessible=accessible))
+    entry = {mode: summarize(samples[mode]) for mode in MODES}
+    ratios = [(tagged['layout_seconds'] + tagged['write_seconds']) / (base['layout_seconds'] + base['write_seconds'])
+              for base, tagged in zip(samples['normal'], samples['acessível'])]
+    entry['overhead'] = statistics.median(ratios) - 1
+    return entry
+
+
+def run(documents, locale=DEFAULT_LOCALE, logo=None, runs=5):
+    return [{'document': doc_id, 'locale': locale, **measure(doc_id, locale, logo, runs)} for doc_id in documents]
+
+
+def check_repeatable(documents, logo=None):
+    """Lista de (documento, locale, modo, mudanças) que saem diferentes ao gerar de novo"""
+    problems = []
+    for mode, accessible in MODES.items():
+        for locale in LOCALES:
+            for doc_id in documents:
+                renders = []
+                for _ in range(2):
+                    buffer = BytesIO()
+                    write_document(buffer, doc_id, locale, logo, accessible=accessible)
+                    renders.append(buffer.getvalue())
+                changes = diff_pages(*renders)
+                if any(changes.values()):
+                    problems.append((doc_id, locale, mode, changes))
+    return problems
+
+
+def check_incremental(documents, logo=None):
+    """Lista de (documento, modo, erro) em que anterior + atualização incremental não dá o documento novo"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        PdfReader = None
+        print("⚠️  pypdf não instalado: atualização incremental conferida só pelos hashes das páginas")
+    problems = []
+    for mode, accessible in MODES.items():
+        for doc_id in documents:
+            renders = []
+            for name in ('Maria', 'Maria Eduarda'):
+                buffer = BytesIO()
+                write_document(buffer, doc_id, DEFAULT_LOCALE, logo, {'id': 1, 'name': name}, accessible)
+                renders.append(buffer.getvalue())
+            previous, current = renders
+            updated = previous + incremental_update(previous, current)
+            try:
+                if PDFFile(updated).page_hashes() != PDFFile(current).page_hashes():
+                    raise ValueError("páginas diferentes do documento gerado do zero")
+                if PdfReader:
+                    pages = [page.extract_text() for page in PdfReader(BytesIO(updated), strict=True).pages]
+                    if pages != [page.extract_text() for page in PdfReader(BytesIO(current), strict=True).pages]:
+                        raise ValueError("texto das páginas diferente do documento gerado do zero (pypdf)")
+            except Exception as e:
+                problems.append((doc_id, mode, f"{type(e).__name__}: {e}"))
+    return problems
+
+
+def process_memory():
+    """USS e PSS do processo atual em bytes (/proc/self/smaps_rollup)"""
+    values = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('Pss', 'Private_Clean', 'Private_Dirty'):
+                values[key] = int(value.split()[0]) * 1024
+    return {'uss': values['Private_Clean'] + values['Private_Dirty'], 'pss': values['Pss']}
+
+
+def render_and_measure(doc_id, locale, logo, accessible):
+    write_document(BytesIO(), doc_id, locale, logo, accessible=accessible)
+    return os.getpid(), process_memory()
+
+
+def measure_workers(pool, jobs, documents, locale, logo, accessible, rounds=3):
+    """Média de USS e PSS dos workers, medidos depois de cada um gerar alguns documentos"""
+    with pool:
+        futures = [pool.submit(render_and_measure, doc_id, locale, logo, accessible)
+                   for _ in range(jobs * rounds) for doc_id in documents]
+        memory = dict(future.result() for future in futures)
+    return {'workers': len(memory),
+            'uss': statistics.mean(m['uss'] for m in memory.values()),
+            'pss': statistics.mean(m['pss'] for m in memory.values())}
+
+
+def run_workers(jobs, documents, locale=DEFAULT_LOCALE, logo=None, accessible=False):
+    # spawn primeiro: o pré-fork prepara e congela o estado do processo principal
+    spawn = create_pool(jobs, accessible)
+    results = {'spawn': measure_workers(spawn, jobs, documents, locale, logo, accessible)}
+    prefork = create_pool(jobs, accessible, (locale,), documents, logo, prefork=True)
+    results['pré-fork'] = measure_workers(prefork, jobs, documents, locale, logo, accessible)
+    return results
+
+
+def print_workers(results):
+    print(f"{'workers':<12}{'processos':>10}{'USS MB':>9}{'PSS MB':>9}")
+    for mode, m in results.items():
+        print(f"{mode:<12}{m['workers']:>10}{m['uss'] / 2**20:>9.1f}{m['pss'] / 2**20:>9.1f}")
+
+
+def print_table(results):
+    print(f"{'documento':<12}{'modo':<11}{'layout ms':>11}{'gravação ms':>13}{'total ms':>10}"
+          f"{'páginas':>9}{'KB':>8}")
+    for entry in results:
+        for mode in MODES:
+            m = entry[mode]
+            print(f"{entry['document']:<12}{mode:<11}{m['layout'] * 1000:>11.1f}{m['write'] * 1000:>13.1f}"
+                  f"{m['total'] * 1000:>10.1f}{m['pages']:>9}{m['bytes'] / 1024:>8.0f}")
+        print(f"{'':<12}{'custo extra':<11}{entry['overhead']:>34.0%}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de geração dos PDFs de bônus")
+    parser.add_argument('--documents', default=','.join(DOCUMENTS),
+                        help=f"Documentos separados por vírgula (padrão: {','.join(DOCUMENTS)})")
+    parser.add_argument('--locale', default=DEFAULT_LOCALE, help=f"Locale (padrão: {DEFAULT_LOCALE})")
+    parser.add_argument('--logo', default=None, help="Logo da capa: caminho ou URL")
+    parser.add_argument('--runs', type=int, default=5, help="Renderizações medidas por combinação (padrão: 5)")
+    parser.add_argument('--max-overhead', type=float, default=MAX_OVERHEAD,
+                        help=f"Custo extra máximo do modo acessível em %% do tempo total (padrão: {MAX_OVERHEAD})")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="Mede a memória por worker de um pool com N processos (spawn x pré-fork)")
+    parser.add_argument('--accessible', action='store_true', help="Com --workers, usa o modo acessível")
+    parser.add_argument('--check', action='store_true',
+                        help="Confere se gerar de novo no mesmo processo dá as mesmas páginas (todos os locales)")
+    parser.add_argument('--json', action='store_true', help="Resultado em JSON no lugar da tabela")
+    args = parser.parse_args(argv)
+
+    args.documents = [doc_id.strip() for doc_id in args.documents.split(',') if doc_id.strip()]
+    unknown = [doc_id for doc_id in args.documents if doc_id not in DOCUMENTS]
+    if unknown:
+        parser.error(f"documento desconhecido: {', '.join(unknown)}")
+    if args.locale not in LOCALES:
+        parser.error(f"locale não suportado: {args.locale}")
+    if args.runs < 1:
+        parser.error("--runs deve ser pelo menos 1")
+    if args.workers and not os.path.exists('/proc/self/smaps_rollup'):
+        parser.error("--workers só funciona no Linux")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.check:
+        problems = check_repeatable(args.documents, args.logo)
+        for doc_id, locale, mode, changes in problems:
+            pages = sorted(set().union(*changes.values()))
+            print(f"❌ {doc_id} ({locale}, {mode}): páginas {', '.join(map(str, pages))} mudaram")
+        update_problems = check_incremental(args.documents, args.logo)
+        for doc_id, mode, error in update_problems:
+            print(f"❌ {doc_id} ({mode}): atualização incremental inválida - {error}")
+        if problems or update_problems:
+            sys.exit(1)
+        print("✅ Todas as páginas iguais ao gerar de novo e com atualização incremental")
+        sys.exit(0)
+    if args.workers:
+        results = run_workers(args.workers, args.documents, args.locale, args.logo, args.accessible)
+        show = print_workers
+    else:
+        results = run(args.documents, args.locale, args.logo, args.runs)
+        show = print_table
+    if args.json:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        show(results)
+    if not args.workers:
+        over = [entry for entry in results if entry['overhead'] * 100 > args.max_overhead]
+        for entry in over:
+            print(f"❌ {entry['document']}: modo acessível custa {entry['overhead']:.0%} a mais "
+                  f"(limite {args.max_overhead:.0f}%)", file=sys.stderr)
+        if over:
+            sys.exit(1)
@@ -0,0 +1,455 @@
+"""
+Modo acessível dos PDFs de bônus - TribeBuild (tagged PDF + PDF/A-2b)
+
+Com accessible=True o documento é gerado com:
+- árvore de estrutura (títulos H1/H2/H3, parágrafos P, listas L/LI/LBody,
+  sumário TOC/TOCI e figuras com texto alternativo), montada enquanto o
+  layout desenha cada flowable - cada trecho de conteúdo ganha um MCID
+  na hora em que é desenhado, sem segunda passada;
+- checkboxes e links do sumário na árvore (Form/Link com OBJR), com só a
+  aparência N nos widgets, como pede o PDF/A-2;
+- header/footer e bordas dos checkboxes marcados como artefatos;
+- fontes TrueType embutidas (Bitstream Vera, distribuída com o ReportLab)
+  no lugar da Helvetica, que não é embutida - só com os glifos usados, e
+  cada subset é montado e comprimido uma vez por processo;
+- metadados XMP com identificação PDF/A-2b, OutputIntent sRGB, MarkInfo,
+  idioma e título exibido pelo leitor.
+
+Os flowables só consultam canv.structure: no modo normal ele não existe e
+nada disso roda.
+"""
+
+import re
+import struct
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from PIL import ImageCms
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFDictionary, PDFName, PDFObject, PDFStream, PDFString, format
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace
+from reportlab.pdfgen.canvas import Canvas
+
+# Fonte embutida usada no lugar de cada Helvetica
+FONT_MAP = {
+    'Helvetica': 'BonusSans',
+    'Helvetica-Bold': 'BonusSans-Bold',
+    'Helvetica-Oblique': 'BonusSans-Oblique',
+    'Helvetica-BoldOblique': 'BonusSans-BoldOblique',
+}
+
+FONT_FILES = {
+    'BonusSans': 'Vera.ttf',
+    'BonusSans-Bold': 'VeraBd.ttf',
+    'BonusSans-Oblique': 'VeraIt.ttf',
+    'BonusSans-BoldOblique': 'VeraBI.ttf',
+}
+
+# Substitutos para símbolos que a fonte embutida não tem; emojis sem
+# substituto são removidos (PDF/A não permite referências ao glifo .notdef)
+FALLBACK_GLYPHS = {
+    '→': '->',
+    '✅': '•',
+    '□': '•',
+    '❌': '×',
+}
+
+
+# Subsets guardados por fonte (o mesmo documento e locale sempre usam os mesmos caracteres)
+SUBSET_CACHE_SIZE = 64
+
+FLATE = PDFArray([PDFName('FlateDecode')])
+
+# Registros da tabela name que vão nos subsets (os mesmos do subsetter do
+# fontTools): copyright, família, estilo, identificação, nome, versão e nome
+# PostScript. A do Vera traz também o texto da licença, ~3 KB por fonte no PDF.
+SUBSET_NAME_IDS = range(7)
+
+
+def subset_name_table(table):
+    """Tabela name (formato 0) só com os registros SUBSET_NAME_IDS"""
+    version, count, offset = struct.unpack('>HHH', table[:6])
+    if version != 0:
+        return table
+    records = []
+    strings = bytearray()
+    for i in range(count):
+        platform, encoding, language, name_id, length, start = struct.unpack('>6H', table[6 + 12 * i:18 + 12 * i])
+        if name_id in SUBSET_NAME_IDS:
+            records.append(struct.pack('>6H', platform, encoding, language, name_id, length, len(strings)))
+            strings += table[offset + start:offset + start + length]
+    return struct.pack('>HHH', 0, len(records), 6 + 12 * len(records)) + b''.join(records) + strings
+
+
+class CachedSubsetFace(TTFontFace):
+    """
+    TTFontFace que guarda cada subset já montado e comprimido. O ReportLab
+    monta e comprime o font file de novo a cada documento; aqui documentos
+    com os mesmos caracteres reaproveitam os bytes. A tabela name dos
+    subsets fica só com SUBSET_NAME_IDS.
+    """
+
+    def __init__(self, filename):
+        TTFontFace.__init__(self, filename)
+        self._subsets = lru_cache(maxsize=SUBSET_CACHE_SIZE)(self._build_subset)
+
+    def _build_subset(self, codes):
+        data = TTFontFace.makeSubset(self, list(codes))
+        return data, zlib.compress(data)
+
+    def makeSubset(self, subset):
+        return self._subsets(tuple(subset))[0]
+
+    def get_table(self, tag):
+        # Só o makeSubset lê a tabela name por aqui (os nomes da fonte vêm de seek_table)
+        table = TTFontFace.get_table(self, tag)
+        return subset_name_table(table) if tag == 'name' else table
+
+    def addSubsetObjects(self, doc, fontname, subset):
+        descriptor = TTFontFace.addSubsetObjects(self, doc, fontname, subset)
+        if doc.compression:
+            # Com /Filter no dicionário o ReportLab grava o conteúdo como está
+            font_file = doc.idToObject['fontFile:%s(%s)' % (self.filename, fontname)]
+            font_file.content = self._subsets(tuple(subset))[1]
+            font_file.dictionary['Filter'] = FLATE
+        return descriptor
+
+
+def embedded_font(name, filename):
+    """TTFont com subsets só dos caracteres usados (sem reservar o ASCII inteiro) e em cache"""
+    font = TTFont(name, filename, asciiReadable=False)
+    font.face = CachedSubsetFace(filename)
+    return font
+
+
+@lru_cache(maxsize=None)
+def register_fonts():
+    for name, filename in FONT_FILES.items():
+        pdfmetrics.registerFont(embedded_font(name, filename))
+    # <b> e <i> nos parágrafos
+    for bold, italic, suffix in ((0, 0, ''), (1, 0, '-Bold'), (0, 1, '-Oblique'), (1, 1, '-BoldOblique')):
+        addMapping('BonusSans', bold, italic, 'BonusSans' + suffix)
+
+
+def printable(text, font_name):
+    """Troca ou remove os caracteres que a fonte TrueType não tem (fontes Type 1 ficam como estão)"""
+    glyphs = getattr(pdfmetrics.getFont(font_name).face, 'charToGlyph', None)
+    if glyphs is None:
+        return text
+    if all(ord(char) in glyphs for char in text):
+        return text
+    result = []
+    for char in text:
+        if ord(char) in glyphs:
+            result.append(char)
+        else:
+            fallback = FALLBACK_GLYPHS.get(char, '')
+            if all(ord(c) in glyphs for c in fallback):
+                result.append(fallback)
+    return ''.join(result)
+
+
+def plain_title(title):
+    """Título do documento para os metadados (sem o emoji do início)"""
+    return re.sub(r'^\W+', '', title).strip()
+
+
+class StructElement:
+    __slots__ = ('tag', 'parent', 'kids', 'alt', 'pdf')
+
+    def __init__(self, tag, parent=None, alt=None):
+        self.tag = tag
+        self.parent = parent
+        self.kids = []
+        self.alt = alt
+        if parent is not None:
+            parent.kids.append(self)
+
+    def walk(self):
+        yield self
+        for kid in self.kids:
+            if isinstance(kid, StructElement):
+                yield from kid.walk()
+
+
+class AnnotationRef:
+    """Anotação (widget ou link) filha de um elemento da árvore, gravada como OBJR"""
+    __slots__ = ('annotation', 'ref', 'page')
+
+    def __init__(self, annotation, ref, page):
+        self.annotation = annotation
+        self.ref = ref
+        self.page = page
+
+
+class FormattedObject(PDFObject):
+    """Objeto PDF com os bytes já prontos"""
+
+    def __init__(self, data=b''):
+        self.data = data
+
+    def format(self, document):
+        return self.data
+
+
+class StructureTree:
+    """
+    Árvore de estrutura montada durante o layout.
+
+    Itens de lista consecutivos (list_item=True) são agrupados em um L; o
+    primeiro elemento que não é item fecha a lista.
+    """
+
+    def __init__(self):
+        self.root = StructElement('Document')
+        self.open_list = None
+        self.page_mcids = {}  # página -> elementos na ordem dos MCIDs
+        self.annotations = []  # (AnnotationRef, elemento) na ordem em que foram criadas
+        self.annotating = None  # elemento das anotações criadas agora (ver annotated)
+        self._marking = False
+
+    def element(self, tag, parent=None, list_item=False, alt=None):
+        if parent is None:
+            if list_item:
+                if self.open_list is None:
+                    self.open_list = StructElement('L', self.root)
+                parent = StructElement('LBody', StructElement('LI', self.open_list))
+            else:
+                self.open_list = None
+                parent = self.root
+        return StructElement(tag, parent, alt)
+
+    @contextmanager
+    def marked(self, canv, element):
+        """Marca o conteúdo desenhado dentro do bloco como parte de element"""
+        if self._marking:
+            # Conteúdo aninhado (ex: parágrafo dentro de célula) fica no elemento de fora
+            yield
+            return
+        mcids = self.page_mcids.setdefault(canv.getPageNumber(), [])
+        element.kids.append((canv._doc.thisPageRef(), len(mcids)))
+        canv.addLiteral(f'/{element.tag} <</MCID {len(mcids)}>> BDC')
+        mcids.append(element)
+        self._marking = True
+        try:
+            yield
+        finally:
+            self._marking = False
+            canv.addLiteral('EMC')
+
+    def add_annotation(self, canv, annotation, ref):
+        """Liga a anotação recém-criada ao elemento de annotated, se houver"""
+        if self.annotating is not None:
+            kid = AnnotationRef(annotation, ref, canv._doc.thisPageRef())
+            self.annotating.kids.append(kid)
+            self.annotations.append((kid, self.annotating))
+
+    def write(self, doc):
+        """
+        Grava StructTreeRoot e ParentTree no documento; retorna o StructTreeRoot.
+
+        Os elementos (centenas no checklist) já saem formatados em bytes: na
+        hora do save as páginas e os elementos já têm número de objeto, e
+        montar um PDFDictionary por elemento custava a maior parte da
+        gravação do modo acessível. MCIDs da página /Pg do elemento vão como
+        inteiros; só os de outras páginas precisam de um dicionário MCR.
+        As anotações ganham /StructParent depois das chaves das páginas.
+        """
+        tree_root = PDFDictionary({'Type': PDFName('StructTreeRoot')})
+        tree_ref = doc.Reference(tree_root)
+
+        def number(ref):
+            return doc.idToObjectNumberAndVersion[ref.name][0]
+
+        elements = list(self.root.walk())
+        numbers = {}
+        for element in elements:
+            element.pdf = FormattedObject()
+            numbers[id(element)] = number(doc.Reference(element.pdf))
+
+        for element in elements:
+            page = None
+            kids = []
+            for kid in element.kids:
+                if isinstance(kid, StructElement):
+                    kids.append(b'%d 0 R' % numbers[id(kid)])
+                    continue
+                if isinstance(kid, AnnotationRef):
+                    kids.append(b'<< /Type /OBJR /Obj %d 0 R /Pg %d 0 R >>' % (number(kid.ref), number(kid.page)))
+                    continue
+                kid_page, mcid = number(kid[0]), kid[1]
+                page = page or kid_page
+                if kid_page == page:
+                    kids.append(b'%d' % mcid)
+                else:
+                    kids.append(b'<< /Type /MCR /Pg %d 0 R /MCID %d >>' % (kid_page, mcid))
+            parent = numbers[id(element.parent)] if element.parent else number(tree_ref)
+            data = b'<< /Type /StructElem /S /%s /P %d 0 R' % (element.tag.encode('ascii'), parent)
+            if page:
+                data += b' /Pg %d 0 R' % page
+            data += b' /K [ ' + b' '.join(kids) + b' ]'
+            if element.alt:
+                data += b' /Alt ' + format(PDFString(element.alt), doc)
+            element.pdf.data = data + b' >>'
+
+        nums = []
+        for page in sorted(self.page_mcids):
+            refs = b' '.join(b'%d 0 R' % numbers[id(element)] for element in self.page_mcids[page])
+            nums.append(b'%d [ %s ]' % (page - 1, refs))
+        next_key = max(self.page_mcids, default=0)
+        for kid, element in self.annotations:
+            set_struct_parent(kid.annotation, next_key)
+            nums.append(b'%d %d 0 R' % (next_key, numbers[id(element)]))
+            next_key += 1
+        tree_root.dict.update({
+            'K': PDFArray([doc.Reference(self.root.pdf)]),
+            'ParentTree': FormattedObject(b'<< /Nums [ ' + b'\n'.join(nums) + b' ] >>'),
+            'ParentTreeNextKey': next_key,
+        })
+        return tree_root
+
+
+def set_struct_parent(annotation, key):
+    """Grava /StructParent na anotação (dicionário do AcroForm ou Annotation do ReportLab)"""
+    if isinstance(annotation, PDFDictionary):
+        annotation.dict['StructParent'] = key
+    else:
+        # Anotações do ReportLab (ex: LinkAnnotation) só aceitam as chaves de permitted
+        annotation.permitted = annotation.permitted + ('StructParent',)
+        annotation.otherkw['StructParent'] = key
+
+
+@contextmanager
+def annotated(canv, element):
+    """Anotações criadas dentro do bloco entram em element (OBJR); não faz nada no modo normal"""
+    tree = getattr(canv, 'structure', None)
+    if tree is None:
+        yield
+        return
+    tree.annotating = element
+    try:
+        yield
+    finally:
+        tree.annotating = None
+
+
+@contextmanager
+def artifact(canv):
+    """Conteúdo decorativo (fora da árvore de estrutura); não faz nada no modo normal"""
+    tagged = getattr(canv, 'structure', None) is not None
+    if tagged:
+        canv.addLiteral('/Artifact BMC')
+    try:
+        yield
+    finally:
+        if tagged:
+            canv.addLiteral('EMC')
+
+
+class XMPStream(PDFStream):
+    """Stream de metadados sem compressão (PDF/A não permite /Filter nele)"""
+
+    def format(self, document):
+        dictionary = PDFDictionary(self.dictionary.dict.copy())
+        dictionary['Length'] = len(self.content)
+        return format(dictionary, document) + b'\nstream\n' + self.content + b'endstream\n'
+
+
+XMP_TEMPLATE = """<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>
+<x:xmpmeta xmlns:x="adobe:ns:meta/">
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+<rdf:Description rdf:about=""
+ xmlns:dc="http://purl.org/dc/elements/1.1/"
+ xmlns:xmp="http://ns.adobe.com/xap/1.0/"
+ xmlns:pdf="http://ns.adobe.com/pdf/1.3/"
+ xmlns:pdfaid="http://www.aiim.org/pdfa/ns/id/">
+<dc:format>application/pdf</dc:format>
+<dc:title><rdf:Alt><rdf:li xml:lang="x-default">{title}</rdf:li></rdf:Alt></dc:title>
+<dc:creator><rdf:Seq><rdf:li>{author}</rdf:li></rdf:Seq></dc:creator>
+<dc:description><rdf:Alt><rdf:li xml:lang="x-default">{subject}</rdf:li></rdf:Alt></dc:description>
+<dc:language><rdf:Bag><rdf:li>{lang}</rdf:li></rdf:Bag></dc:language>
+<xmp:CreatorTool>{creator}</xmp:CreatorTool>
+<xmp:CreateDate>{date}</xmp:CreateDate>
+<xmp:ModifyDate>{date}</xmp:ModifyDate>
+<pdf:Producer>{producer}</pdf:Producer>
+<pdf:Keywords>{keywords}</pdf:Keywords>
+<pdf:Trapped>False</pdf:Trapped>
+<pdfaid:part>2</pdfaid:part>
+<pdfaid:conformance>B</pdfaid:conformance>
+</rdf:Description>
+</rdf:RDF>
+</x:xmpmeta>
+<?xpacket end="w"?>
+"""
+
+
+@lru_cache(maxsize=None)
+def srgb_profile():
+    """Perfil ICC sRGB já comprimido (Flate), montado uma vez por processo"""
+    return zlib.compress(ImageCms.ImageCmsProfile(ImageCms.createProfile('sRGB')).tobytes())
+
+
+def xmp_metadata(doc, lang):
+    """XMP coerente com o dicionário Info que o ReportLab grava"""
+    info = doc.info
+    year, month, day, hour, minute, second = doc._timeStamp.YMDhms
+    date = (f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
+            f"{doc._timeStamp.dhh:+03d}:{doc._timeStamp.dmm:02d}")
+    return XMP_TEMPLATE.format(
+        title=escape(info.title), author=escape(info.author), subject=escape(info.subject),
+        creator=escape(info.creator), producer=escape(info.producer), keywords=escape(info.keywords),
+        lang=escape(lang or 'x-default'), date=date,
+    ).encode('utf-8')
+
+
+class TaggedCanvas(Canvas):
+    """Canvas do modo acessível: guarda a árvore de estrutura e grava os metadados PDF/A"""
+
+    def __init__(self, *args, **kwargs):
+        # A fonte inicial do canvas também precisa ser embutida (o doctemplate passa None)
+        register_fonts()
+        kwargs['initialFontName'] = kwargs.get('initialFontName') or FONT_MAP['Helvetica']
+        Canvas.__init__(self, *args, **kwargs)
+        self.structure = StructureTree()
+
+    def _setAnnotations(self, page):
+        Canvas._setAnnotations(self, page)
+        if self._pageNumber in self.structure.page_mcids:
+            page.__NoDefault__ = page.__NoDefault__ + ['StructParents', 'Tabs']
+            page.StructParents = self._pageNumber - 1
+            page.Tabs = PDFName('S')
+
+    def _addAnnotation(self, annotation, name=None, addtopage=1):
+        if 'AP' in getattr(annotation, 'dict', ()):
+            # PDF/A-2 (6.3.3): o dicionário de aparências do widget só pode ter N
+            appearances = annotation.dict['AP']
+            annotation.dict['AP'] = PDFDictionary({'N': appearances.dict['N']})
+        Canvas._addAnnotation(self, annotation, name, addtopage)
+        if addtopage:
+            self.structure.add_annotation(self, annotation, self._annotationrefs[-1])
+
+    def save(self):
+        if len(self._code):
+            self.showPage()
+        doc = self._doc
+        catalog = doc.Catalog
+        catalog.StructTreeRoot = self.structure.write(doc)
+        catalog.MarkInfo = PDFDictionary({'Marked': 'true'})
+        catalog.Metadata = XMPStream(
+            PDFDictionary({'Type': PDFName('Metadata'), 'Subtype': PDFName('XML')}),
+            xmp_metadata(doc, getattr(catalog.Lang, 's', None)),
+        )
+        profile = PDFStream(PDFDictionary({'N': 3, 'Filter': FLATE}), srgb_profile())
+        catalog.__NoDefault__ = catalog.__NoDefault__ + ['OutputIntents']
+        catalog.OutputIntents = PDFArray([PDFDictionary({
+            'Type': PDFName('OutputIntent'),
+            'S': PDFName('GTS_PDFA1'),
+            'OutputConditionIdentifier': PDFString('sRGB IEC61966-2.1'),
+            'Info': PDFString('sRGB IEC61966-2.1'),
+            'DestOutputProfile': doc.Reference(profile),
+        })])
+        self.setViewerPreference('DisplayDocTitle', 'true')
+        Canvas.save(self)
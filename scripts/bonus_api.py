@@ -0,0 +1,137 @@
+"""
+API assíncrona para gerar PDFs de bônus - TribeBuild
+
+Para scripts de importação, jobs de admin e outras ferramentas Python que
+precisam gerar os PDFs sem passar pela linha de comando:
+
+    from bonus_api import render_many
+
+    async def entregar(alunos):
+        requests = ({'document': 'checklist', 'locale': a['locale'],
+                     'student': {'id': a['id'], 'name': a['name']}} async for a in alunos)
+        async for result in render_many(requests, concurrency=4):
+            if 'error' in result:
+                ...
+            await salvar(result['request']['student']['id'], result['data'])
+
+Cada request é um dict com:
+    document  'templates', 'guia' ou 'checklist' (obrigatório)
+    locale    padrão pt-BR
+    logo      caminho ou URL da logo da capa
+    student   dados do aluno para personalização (ex: {'id': 7, 'name': 'Maria'})
+    path      se informado, o PDF é gravado nesse caminho; senão volta em bytes
+    accessible  True para gerar tagged PDF + PDF/A-2b (padrão False)
+
+Os renders rodam em um pool de processos (por padrão um pool próprio de workers
+criados por spawn, ver create_bonus_pdfs.create_pool) com no máximo
+`concurrency` renders em andamento: o próximo request só é lido quando
+abre uma vaga, então um gerador lento (ex: consulta ao banco) e o
+consumidor dos resultados controlam o ritmo sem acumular trabalho na
+memória. Os resultados saem na ordem em que ficam prontos. Os workers
+preparam estilos e fontes no initializer; nada roda no processo nem no
+event loop de quem chama (sem fork, aquecimento nem gc.freeze). Como todo
+pool por spawn, o script principal precisa do `if __name__ == "__main__":`.
+
+Cancelar a task ou parar de iterar (break/aclose) cancela os renders que
+ainda não começaram; os que já estão rodando terminam no worker e o
+resultado é descartado.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from bonus_locales import DEFAULT_LOCALE
+from create_bonus_pdfs import DOCUMENTS, create_pool, write_document
+
+
+def render_request(request):
+    """Gera o PDF de um request (executa no worker) e retorna métricas e bytes ou caminho"""
+    doc_id = request['document']
+    if doc_id not in DOCUMENTS:
+        raise ValueError(f"Documento desconhecido: {doc_id} (disponíveis: {', '.join(DOCUMENTS)})")
+    locale = request.get('locale') or DEFAULT_LOCALE
+    logo = request.get('logo')
+    student = request.get('student')
+    accessible = bool(request.get('accessible'))
+
+    path = request.get('path')
+    if path is None:
+        buffer = BytesIO()
+        metrics = write_document(buffer, doc_id, locale, logo, student, accessible)
+        return {'metrics': metrics, 'data': buffer.getvalue()}
+
+    # Arquivo temporário + rename: um render cancelado não deixa PDF pela metade
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    metrics = write_document(path + '.tmp', doc_id, locale, logo, student, accessible)
+    os.replace(path + '.tmp', path)
+    return {'metrics': metrics, 'path': path}
+
+
+async def _iterate(requests):
+    if hasattr(requests, '__aiter__'):
+        async for request in requests:
+            yield request
+    else:
+        for request in requests:
+            yield request
+
+
+async def render_many(requests, concurrency=None, executor=None, recorder=None):
+    """
+    Gera os PDFs de requests (iterável ou iterável assíncrono de dicts) e
+    devolve cada resultado assim que fica pronto.
+
+    Cada resultado é um dict com 'request', 'metrics' e 'data' (bytes) ou
+    'path'; se o render falhar, traz 'error' (a exceção) no lugar deles.
+
+    concurrency: renders simultâneos (padrão: nº de CPUs).
+    executor: ProcessPoolExecutor do chamador (não é encerrado aqui); por
+    padrão é criado um pool (spawn) com concurrency processos. Executor de
+    threads não é aceito: o render usa estado global do ReportLab e caches
+    sem lock.
+    recorder: MetricsRecorder (bonus_metrics) que recebe as métricas.
+    """
+    if executor is not None and not isinstance(executor, ProcessPoolExecutor):
+        raise TypeError(f"executor precisa ser um ProcessPoolExecutor, não {type(executor).__name__}")
+    loop = asyncio.get_running_loop()
+    concurrency = concurrency or os.cpu_count() or 1
+    own_executor = executor is None
+    if own_executor:
+        executor = create_pool(concurrency)
+
+    source = _iterate(requests)
+    exhausted = False
+    pending = {}
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    request = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[loop.run_in_executor(executor, render_request, request)] = request
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                request = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'request': request, 'error': e}
+                else:
+                    result['request'] = request
+                    if recorder:
+                        recorder.record(result['metrics'])
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        await source.aclose()
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
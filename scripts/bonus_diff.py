@@ -0,0 +1,247 @@
+"""
+Comparação entre versões dos PDFs de bônus - TribeBuild
+
+Depois de uma pequena edição de texto só algumas páginas mudam. Este módulo
+compara a versão nova (já montada, em memória) com o PDF anterior página a
+página e gera a atualização incremental que leva de um ao outro:
+
+- diff_pages: hash de cada página (conteúdo, recursos e anotações, sem
+  depender da numeração dos objetos) e lista das páginas alteradas,
+  adicionadas e removidas;
+- incremental_update: bytes a anexar ao PDF anterior (revisão incremental,
+  ISO 32000 7.5.6) com só os objetos que mudaram. Cada objeto da versão
+  nova ou é idêntico ao de mesmo número no arquivo anterior ou vai na
+  atualização, então o resultado é exatamente o documento novo.
+
+O leitor é mínimo e cobre o que o ReportLab grava (tabela xref clássica,
+sem object streams), inclusive arquivos que já receberam atualizações.
+"""
+
+import hashlib
+import re
+
+REF = re.compile(rb'(\d+) (\d+) R\b')
+PARENT = re.compile(rb'/Parent \d+ \d+ R')
+OBJ_HEADER = re.compile(rb'\s*(\d+) (\d+) obj\s*')
+STREAM = re.compile(rb'\s*stream\r?\n')
+LENGTH = re.compile(rb'/Length (\d+)\b(?! \d+ R)')
+ID = re.compile(rb'/ID\s*\[\s*<([0-9a-fA-F]*)>\s*<([0-9a-fA-F]*)>\s*\]')
+
+
+def _dictionary_end(data, pos):
+    """Posição logo após o dicionário que começa em pos (ignora strings)"""
+    depth = 0
+    while pos < len(data):
+        if data.startswith(b'<<', pos):
+            depth += 1
+            pos += 2
+        elif data.startswith(b'>>', pos):
+            depth -= 1
+            pos += 2
+            if depth == 0:
+                return pos
+        elif data[pos:pos + 1] == b'(':
+            # String literal: parênteses balanceados, com escapes
+            nesting = 0
+            while pos < len(data):
+                char = data[pos:pos + 1]
+                if char == b'\\':
+                    pos += 1
+                elif char == b'(':
+                    nesting += 1
+                elif char == b')':
+                    nesting -= 1
+                    if nesting == 0:
+                        break
+                pos += 1
+            pos += 1
+        elif data[pos:pos + 1] == b'<':
+            pos = data.index(b'>', pos) + 1
+        else:
+            pos += 1
+    raise ValueError("Dicionário sem fim no PDF")
+
+
+class PDFFile:
+    """Objetos de um PDF gerado pelo ReportLab, pela tabela xref"""
+
+    def __init__(self, data):
+        self.data = data
+        self.offsets = {}
+        self.trailer = None
+        self._objects = {}
+        self._hashes = {}
+
+        found = re.findall(rb'startxref\s+(\d+)', data[-1024:])
+        if not found:
+            raise ValueError("PDF sem startxref")
+        self.startxref = int(found[-1])
+        offset = self.startxref
+        while offset is not None:
+            trailer = self._read_xref(offset)
+            self.trailer = self.trailer or trailer
+            prev = re.search(rb'/Prev (\d+)', trailer)
+            offset = int(prev.group(1)) if prev else None
+
+    def _read_xref(self, offset):
+        """Lê uma seção xref (as mais recentes, lidas antes, prevalecem) e retorna o trailer"""
+        if not self.data.startswith(b'xref', offset):
+            raise ValueError("Só PDFs com tabela xref clássica são suportados")
+        trailer_pos = self.data.index(b'trailer', offset)
+        tokens = self.data[offset + 4:trailer_pos].split()
+        pos = 0
+        while pos < len(tokens):
+            first, count = int(tokens[pos]), int(tokens[pos + 1])
+            pos += 2
+            for num in range(first, first + count):
+                entry_offset, _, kind = tokens[pos:pos + 3]
+                self.offsets.setdefault(num, int(entry_offset) if kind == b'n' else None)
+                pos += 3
+        return self.data[trailer_pos:self.data.index(b'startxref', trailer_pos)]
+
+    def _trailer_ref(self, key):
+        match = re.search(rb'/' + key + rb' (\d+) \d+ R', self.trailer)
+        return int(match.group(1)) if match else None
+
+    @property
+    def size(self):
+        return int(re.search(rb'/Size (\d+)', self.trailer).group(1))
+
+    def object(self, num):
+        """(dicionário ou valor, dados do stream ou None) do objeto num"""
+        if num not in self._objects:
+            self._objects[num] = self._parse(num)
+        return self._objects[num][:2]
+
+    def raw(self, num):
+        """Bytes do objeto entre 'obj' e 'endobj'"""
+        if num not in self._objects:
+            self._objects[num] = self._parse(num)
+        return self._objects[num][2]
+
+    def _parse(self, num):
+        offset = self.offsets.get(num)
+        if offset is None:
+            raise ValueError(f"Objeto {num} não existe no PDF")
+        header = OBJ_HEADER.match(self.data, offset)
+        if header is None or int(header.group(1)) != num:
+            raise ValueError(f"Tabela xref inválida no objeto {num}")
+        start = value_start = header.end()
+        stream = None
+        if self.data.startswith(b'<<', value_start):
+            end = _dictionary_end(self.data, value_start)
+            value = self.data[value_start:end]
+            stream_header = STREAM.match(self.data, end)
+            if stream_header:
+                length = LENGTH.search(value)
+                stream_start = stream_header.end()
+                if length:
+                    stream = self.data[stream_start:stream_start + int(length.group(1))]
+                else:
+                    stream = self.data[stream_start:self.data.index(b'endstream', stream_start)]
+                end = stream_start + len(stream)
+            end = self.data.index(b'endobj', end)
+        else:
+            end = self.data.index(b'endobj', start)
+            value = self.data[value_start:end].strip()
+        return value, stream, self.data[start:end]
+
+    def pages(self):
+        """Números dos objetos das páginas, em ordem"""
+        catalog, _ = self.object(self._trailer_ref(b'Root'))
+        pages = []
+
+        def collect(num):
+            node, _ = self.object(num)
+            kids = re.search(rb'/Kids\s*\[([^\]]*)\]', node)
+            if kids and b'/Type /Pages' in node:
+                for ref in REF.finditer(kids.group(1)):
+                    collect(int(ref.group(1)))
+            else:
+                pages.append(num)
+
+        collect(int(re.search(rb'/Pages (\d+) \d+ R', catalog).group(1)))
+        return pages
+
+    def page_hashes(self):
+        pages = self.pages()
+        index = {num: i for i, num in enumerate(pages)}
+        return [self._hash(num, index, set(), page=True) for num in pages]
+
+    def _hash(self, num, index, visiting, page=False):
+        """
+        Hash do objeto e de tudo que ele referencia. Referências a páginas
+        (destinos de links, /P dos campos) viram o índice da página e /Parent
+        é ignorado, então o hash não depende da numeração dos objetos.
+        """
+        if not page and num in index:
+            return b'page:%d' % index[num]
+        if num in self._hashes:
+            return self._hashes[num]
+        if num in visiting:
+            return b'cycle'
+        visiting.add(num)
+        value, stream = self.object(num)
+        value = REF.sub(lambda ref: self._hash(int(ref.group(1)), index, visiting), PARENT.sub(b'', value))
+        digest = hashlib.sha256(value + b'\0' + (stream or b'')).hexdigest().encode()
+        visiting.discard(num)
+        self._hashes[num] = digest
+        return digest
+
+
+def diff_pages(previous, current):
+    """
+    Compara dois PDFs (bytes) página a página; retorna as páginas (a partir
+    de 1) alteradas, adicionadas e removidas.
+    """
+    before = PDFFile(previous).page_hashes()
+    after = PDFFile(current).page_hashes()
+    common = min(len(before), len(after))
+    return {
+        'changed_pages': [i + 1 for i in range(common) if before[i] != after[i]],
+        'added_pages': list(range(common + 1, len(after) + 1)),
+        'removed_pages': list(range(common + 1, len(before) + 1)),
+    }
+
+
+def incremental_update(previous, current):
+    """
+    Bytes a anexar a previous para que o arquivo passe a ser o documento
+    current: objetos novos ou alterados, nova seção xref e trailer com /Prev.
+    """
+    old, new = PDFFile(previous), PDFFile(current)
+    changed = [num for num, offset in sorted(new.offsets.items())
+               if offset is not None and (old.offsets.get(num) is None or old.raw(num) != new.raw(num))]
+
+    update = bytearray(b'' if previous.endswith(b'\n') else b'\n')
+    base = len(previous)
+    offsets = {}
+    for num in changed:
+        offsets[num] = base + len(update)
+        update += b'%d 0 obj\n' % num + new.raw(num).rstrip(b'\r\n') + b'\nendobj\n'
+
+    xref_offset = base + len(update)
+    # A seção começa pela entrada 0 (cabeça da lista de livres), como nos outros
+    # geradores: leitores estritos (ex: pypdf) estranham xref que não começa em 0
+    update += b'xref\n0 1\n0000000000 65535 f \n'
+    runs = []
+    for num in changed:
+        if runs and runs[-1][-1] == num - 1:
+            runs[-1].append(num)
+        else:
+            runs.append([num])
+    for run in runs:
+        update += b'%d %d\n' % (run[0], len(run))
+        for num in run:
+            update += b'%010d 00000 n \n' % offsets[num]
+
+    trailer = [b'/Size %d' % max(old.size, new.size), b'/Root %d 0 R' % new._trailer_ref(b'Root'),
+               b'/Prev %d' % old.startxref]
+    if new._trailer_ref(b'Info') is not None:
+        trailer.append(b'/Info %d 0 R' % new._trailer_ref(b'Info'))
+    old_id, new_id = ID.search(old.trailer), ID.search(new.trailer)
+    if old_id and new_id:
+        # Primeiro ID é o do arquivo original; o segundo identifica a revisão
+        trailer.append(b'/ID [<%s><%s>]' % (old_id.group(1), new_id.group(2)))
+    update += b'trailer\n<<\n' + b'\n'.join(trailer) + b'\n>>\nstartxref\n%d\n%%%%EOF\n' % xref_offset
+    return bytes(update)
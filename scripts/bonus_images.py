@@ -0,0 +1,177 @@
+"""
+Imagens dos PDFs de bônus - TribeBuild
+
+Logos (apps.logo_url), thumbnails de produtos e os PNGs de
+public/images/integrations são reduzidos ao tamanho em que aparecem no PDF,
+recomprimidos (JPEG para fotos, Flate para logos/transparência) e guardados
+em cache pelo hash do conteúdo, então cada imagem é decodificada uma vez por
+processo mesmo gerando milhares de PDFs. Dentro de um PDF, o ReportLab
+reaproveita o mesmo XObject para a mesma imagem. Arquivos e URLs são lidos
+uma vez por processo (bytes e tamanho em pixels).
+
+Os PDFs são gravados sem ASCII85 só dentro de binary_streams (em volta do
+doc.build); o rl_config do ReportLab fica como estava fora dele, e builds
+em threads do mesmo processo esperam a vez.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from io import BytesIO
+from urllib.request import urlopen
+
+from PIL import Image
+from reportlab import rl_config
+from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+
+# Resolução de saída (suficiente para impressão e telas retina)
+DEFAULT_DPI = 150
+
+# Qualidade JPEG usada para imagens fotográficas
+JPEG_QUALITY = 85
+
+# Logos das plataformas de pagamento
+INTEGRATIONS_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'public', 'images', 'integrations')
+)
+
+# (hash, largura px, altura px) -> ImageReader pronto para o PDF
+CACHE_SIZE = 256
+_prepared = OrderedDict()
+_shared = {}  # imagens preparadas antes do fork, só lidas pelos workers (ver freeze_cache)
+CACHE_STATS = {'hits': 0, 'misses': 0}
+
+# rl_config.useA85 é global: builds em threads do mesmo processo esperam a vez (ver binary_streams)
+_streams_lock = threading.RLock()
+
+
+@lru_cache(maxsize=64)
+def _download(url):
+    with urlopen(url, timeout=10) as response:
+        return response.read()
+
+
+@lru_cache(maxsize=128)
+def _load_source(source):
+    """(bytes, tamanho em px) de um caminho ou URL - lido uma vez por processo"""
+    if source.startswith(('http://', 'https://')):
+        data = _download(source)
+    else:
+        with open(source, 'rb') as f:
+            data = f.read()
+    return data, image_size(data)
+
+
+def image_size(data):
+    """Largura e altura em pixels (só lê o cabeçalho)"""
+    with Image.open(BytesIO(data)) as image:
+        return image.size
+
+
+def load_image(source):
+    """Lê a imagem de um caminho, URL (http/https) ou bytes; retorna (bytes, (largura px, altura px))"""
+    if isinstance(source, bytes):
+        return source, image_size(source)
+    return _load_source(source)
+
+
+@contextmanager
+def binary_streams():
+    """
+    Grava os streams do PDF em binário (ASCII85 aumenta imagens e páginas em
+    ~25%) dentro do bloco, em volta do doc.build. O ReportLab lê a opção
+    global rl_config.useA85, sem ajuste por documento, então os builds do
+    mesmo processo rodam um de cada vez: paralelismo é com processos.
+    """
+    with _streams_lock:
+        previous = rl_config.useA85
+        rl_config.useA85 = 0
+        try:
+            yield
+        finally:
+            rl_config.useA85 = previous
+
+
+def prepare_image(data, width, height, dpi=DEFAULT_DPI):
+    """
+    Reduz a imagem para width x height pontos no DPI de saída e escolhe a
+    compressão: Flate para imagens com transparência ou poucas cores (logos),
+    JPEG para fotos. O resultado fica em cache pelo hash do conteúdo.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    target = (max(1, round(width / inch * dpi)), max(1, round(height / inch * dpi)))
+    key = (digest,) + target
+
+    reader = _shared.get(key)
+    if reader is None:
+        reader = _prepared.get(key)
+        if reader is not None:
+            _prepared.move_to_end(key)
+    if reader is not None:
+        CACHE_STATS['hits'] += 1
+        return reader
+    CACHE_STATS['misses'] += 1
+
+    with Image.open(BytesIO(data)) as image:
+        image.load()
+        if image.mode == 'P' and 'transparency' in image.info:
+            image = image.convert('RGBA')
+        has_alpha = image.mode in ('RGBA', 'LA') and image.getchannel('A').getextrema()[0] < 255
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    # Só reduz - imagens menores que o alvo ficam como estão
+    image.thumbnail(target, Image.LANCZOS)
+
+    if has_alpha or image.getcolors(256) is not None:
+        reader = ImageReader(image)
+    else:
+        buffer = BytesIO()
+        image.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+        reader = ImageReader(BytesIO(buffer.getvalue()))
+
+    _prepared[key] = reader
+    if len(_prepared) > CACHE_SIZE:
+        _prepared.popitem(last=False)
+    return reader
+
+
+def freeze_cache():
+    """Passa as imagens do LRU para a camada compartilhada (antes do fork dos workers)"""
+    _shared.update(_prepared)
+    _prepared.clear()
+
+
+class BrandImage(Flowable):
+    """
+    Imagem que cabe em width x height (mantendo a proporção), desenhada a
+    partir da versão reduzida em cache. alt é o texto alternativo da figura
+    no modo acessível.
+    """
+
+    def __init__(self, source, width, height, dpi=DEFAULT_DPI, hAlign='CENTER', alt=None):
+        Flowable.__init__(self)
+        self.data, (pixel_width, pixel_height) = load_image(source)
+        self.alt = alt
+        self.dpi = dpi
+        self.hAlign = hAlign
+
+        scale = min(width / pixel_width, height / pixel_height)
+        self.drawWidth = pixel_width * scale
+        self.drawHeight = pixel_height * scale
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        reader = prepare_image(self.data, self.drawWidth, self.drawHeight, self.dpi)
+        tree = getattr(self.canv, 'structure', None)
+        if tree is None:
+            self.canv.drawImage(reader, 0, 0, self.drawWidth, self.drawHeight, mask='auto')
+            return
+        with tree.marked(self.canv, tree.element('Figure', alt=self.alt)):
+            self.canv.drawImage(reader, 0, 0, self.drawWidth, self.drawHeight, mask='auto')
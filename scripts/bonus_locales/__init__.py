@@ -0,0 +1,26 @@
+"""
+Catálogos de mensagens dos PDFs de bônus - TribeBuild
+
+Cada locale é um módulo com um dicionário CATALOG contendo os textos dos
+3 documentos. Para adicionar um idioma, crie o módulo (mesma estrutura do
+pt_BR.py) e registre em LOCALES.
+"""
+
+import importlib
+
+DEFAULT_LOCALE = 'pt-BR'
+
+# Locale -> módulo do catálogo
+LOCALES = {
+    'pt-BR': 'pt_BR',
+    'es': 'es',
+    'en': 'en',
+}
+
+
+def get_catalog(locale):
+    """Retorna o catálogo de mensagens do locale"""
+    if locale not in LOCALES:
+        raise ValueError(f"Locale não suportado: {locale} (disponíveis: {', '.join(LOCALES)})")
+    module = importlib.import_module(f".{LOCALES[locale]}", __name__)
+    return module.CATALOG
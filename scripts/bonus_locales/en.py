@@ -0,0 +1,738 @@
+"""Catálogo en dos PDFs de bônus"""
+
+CATALOG = {
+    'footer': "TribeBuild - Turn your knowledge into an exclusive app",
+    'page': "Page {page}",
+    'value': "Value: {price} | Your exclusive TribeBuild bonus",
+    'made_with': "Made with 💙 by TribeBuild",
+    'prepared_for': "Prepared exclusively for {name}",
+
+    # Ready-Made Templates
+    'templates': {
+        'title': "📋 READY-MADE TEMPLATES",
+        'subtitle': "Copy, paste and customize for your business",
+        'price': "R$197",
+        'index_title': "📑 WHAT YOU WILL FIND",
+        'sections': [
+            {
+                'title': "1. WELCOME EMAILS",
+                'models': [
+                    {
+                        'title': "📧 Template 1: Warm Welcome",
+                        'body': """
+    <b>Subject:</b> Welcome to the [COURSE NAME] family! 🎉<br/><br/>
+    Hi, [NAME]!<br/><br/>
+    We're so happy to have you here! You just took the first step toward [TRANSFORMATION].<br/><br/>
+    Your app access is already unlocked. To get started:<br/>
+    1. Download the app: [LINK]<br/>
+    2. Log in with this email<br/>
+    3. Start with the "First Steps" module<br/><br/>
+    Any questions, I'm here!<br/><br/>
+    Best,<br/>
+    [YOUR NAME]
+    """,
+                        'tip': "💡 Tip: Customize the [TRANSFORMATION] field with the main outcome of your course.",
+                    },
+                    {
+                        'title': "📧 Template 2: Getting Started",
+                        'body': """
+    <b>Subject:</b> Where to start? Your quick guide is here<br/><br/>
+    Hey, [NAME]!<br/><br/>
+    I know the question sometimes comes up: "Where do I start?"<br/><br/>
+    Relax, I've prepared a clear path for you:<br/><br/>
+    📱 <b>STEP 1:</b> Install the app on your phone's home screen<br/>
+    📚 <b>STEP 2:</b> Watch the "Welcome" lesson (5 min)<br/>
+    ✅ <b>STEP 3:</b> Complete the day 1 exercise<br/><br/>
+    In 7 days you'll already see the first results!<br/><br/>
+    Ready?<br/>
+    [YOUR NAME]
+    """,
+                    },
+                    {
+                        'title': "📧 Template 3: Re-engagement (7 days)",
+                        'body': """
+    <b>Subject:</b> [NAME], we miss you! 💙<br/><br/>
+    Hi, [NAME]!<br/><br/>
+    I noticed you haven't opened the app in a few days.<br/><br/>
+    Is everything okay? If you're having any trouble, let me know and I'll help!<br/><br/>
+    In the meantime, I've unlocked a special lesson for you: [LESSON LINK]<br/><br/>
+    It's about [INTERESTING TOPIC] and takes only 8 minutes.<br/><br/>
+    See you there!<br/>
+    [YOUR NAME]
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "2. WHATSAPP MESSAGES",
+                'models': [
+                    {
+                        'title': "💬 Template 1: Purchase Confirmation",
+                        'body': """
+    🎉 *Congratulations on your decision, [NAME]!*<br/><br/>
+    Your access to [COURSE NAME] is already unlocked!<br/><br/>
+    📱 *Next step:*<br/>
+    Open the app with this link: [LINK]<br/><br/>
+    Any questions, just message me here!<br/><br/>
+    Welcome to the family! 💙
+    """,
+                    },
+                    {
+                        'title': "💬 Template 2: Lesson Reminder",
+                        'body': """
+    Hey, [NAME]! 👋<br/><br/>
+    Just a quick reminder that there's a new lesson in the app!<br/><br/>
+    📚 *[LESSON NAME]*<br/>
+    ⏱️ Duration: X minutes<br/><br/>
+    This lesson is about [TOPIC] and will help you [BENEFIT].<br/><br/>
+    Shall we watch it? 🚀
+    """,
+                    },
+                    {
+                        'title': "💬 Template 3: Feedback Request",
+                        'body': """
+    Hi, [NAME]! How are you?<br/><br/>
+    I saw you've already completed [X]% of the course! 🎯<br/><br/>
+    I'd love to know: what do you think so far?<br/><br/>
+    Your feedback is super important so I can keep improving!<br/><br/>
+    Let me know! 💙
+    """,
+                    },
+                    {
+                        'title': "💬 Template 4: Upgrade Offer",
+                        'body': """
+    [NAME], I have some news! 🎁<br/><br/>
+    Since you're a student of [BASIC COURSE], I've unlocked a special deal for you:<br/><br/>
+    *[UPGRADE NAME]* with *30% OFF*!<br/><br/>
+    ✅ [Benefit 1]<br/>
+    ✅ [Benefit 2]<br/>
+    ✅ [Benefit 3]<br/><br/>
+    Valid only until [DATE].<br/><br/>
+    Want to know more? Message me! 🚀
+    """,
+                    },
+                    {
+                        'title': "💬 Template 5: Proactive Support",
+                        'body': """
+    Hi, [NAME]! 👋<br/><br/>
+    Just checking that everything is fine with your app access.<br/><br/>
+    If you have any questions about:<br/>
+    • How to access the lessons<br/>
+    • How to use the community<br/>
+    • Anything else<br/><br/>
+    Just message me, okay? I'm here to help! 💙
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "3. PRODUCT DESCRIPTIONS",
+                'models': [
+                    {
+                        'title': "📝 Template 1: Online Course",
+                        'body': """
+    <b>[COURSE NAME]</b><br/><br/>
+    You're one step away from [MAIN TRANSFORMATION].<br/><br/>
+    <b>What you will learn:</b><br/>
+    ✅ [Benefit 1 with a specific result]<br/>
+    ✅ [Benefit 2 with a specific result]<br/>
+    ✅ [Benefit 3 with a specific result]<br/>
+    ✅ [Benefit 4 with a specific result]<br/><br/>
+    <b>What's included:</b><br/>
+    📱 Exclusive app with your brand<br/>
+    📚 [X] modules with [Y] lessons<br/>
+    👥 Access to the student community<br/>
+    📲 New content notifications<br/>
+    🎁 [Special bonus]<br/><br/>
+    <b>Who it's for:</b><br/>
+    • [Profile 1]<br/>
+    • [Profile 2]<br/>
+    • [Profile 3]<br/><br/>
+    <b>Guarantee:</b> 7 days to try it. If you don't like it, we'll refund your money.
+    """,
+                    },
+                    {
+                        'title': "📝 Template 2: Mentorship",
+                        'body': """
+    <b>[NAME] Mentorship</b><br/><br/>
+    Personalized guidance for you to [RESULT].<br/><br/>
+    <b>How it works:</b><br/>
+    🗓️ [X] live sessions per month<br/>
+    📱 Exclusive app with all the content<br/>
+    💬 Private group for questions<br/>
+    📋 Weekly assignments with feedback<br/><br/>
+    <b>Mentee results:</b><br/>
+    "[Testimonial 1]" - Name<br/>
+    "[Testimonial 2]" - Name<br/><br/>
+    <b>Limited spots:</b> Only [X] spots per cohort.
+    """,
+                    },
+                    {
+                        'title': "📝 Template 3: Community/Subscription",
+                        'body': """
+    <b>[NAME] Community</b><br/><br/>
+    The place where [TARGET AUDIENCE] connect to [SHARED GOAL].<br/><br/>
+    <b>What you get as a member:</b><br/>
+    📱 Exclusive community app<br/>
+    🔴 Weekly lives about [TOPIC]<br/>
+    📚 Content library<br/>
+    👥 Networking with [X]+ members<br/>
+    🎁 Discounts on products and events<br/><br/>
+    <b>Investment:</b><br/>
+    Only R$[X]/month or R$[Y]/year (save R$[Z])<br/><br/>
+    <b>Cancel anytime.</b> No fees, no hassle.
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "4. SOCIAL MEDIA POSTS",
+                'models': [
+                    {
+                        'title': "📱 Template 1: Launch Announcement",
+                        'body': """
+    🚀 IT'S OFFICIAL!<br/><br/>
+    After [X months/years] working on this, I can finally announce:<br/><br/>
+    [PRODUCT NAME] is live! 🎉<br/><br/>
+    And the best part: now you access everything through the exclusive APP!<br/><br/>
+    📱 Your phone becomes your classroom<br/>
+    🔔 Notifications so you never miss a thing<br/>
+    👥 Community right in the app<br/><br/>
+    Link in bio to secure your spot! ⬆️<br/><br/>
+    #launch #onlinecourse #[yourniche]
+    """,
+                    },
+                    {
+                        'title': "📱 Template 2: Social Proof",
+                        'body': """
+    Look what [NAME] sent me today 😍<br/><br/>
+    "[Student testimonial with a result]"<br/><br/>
+    This makes me SO happy! 💙<br/><br/>
+    Seeing my students achieve [RESULT] is what keeps me going.<br/><br/>
+    Want to be next?<br/>
+    Link in bio! ⬆️<br/><br/>
+    #results #testimonial #transformation
+    """,
+                    },
+                    {
+                        'title': "📱 Template 3: Value Content + CTA",
+                        'body': """
+    3 mistakes [YOUR AUDIENCE] make that keep them from [RESULT]:<br/><br/>
+    ❌ Mistake 1: [Describe the mistake]<br/>
+    ✅ Solution: [Give the solution]<br/><br/>
+    ❌ Mistake 2: [Describe the mistake]<br/>
+    ✅ Solution: [Give the solution]<br/><br/>
+    ❌ Mistake 3: [Describe the mistake]<br/>
+    ✅ Solution: [Give the solution]<br/><br/>
+    Save this post! 📌<br/><br/>
+    And if you want to go deeper, my course [NAME] has a whole module on this.<br/>
+    Link in bio! ⬆️
+    """,
+                    },
+                    {
+                        'title': "📱 Template 4: Stories - Behind the Scenes",
+                        'body': """
+    <b>Story 1:</b> "You asked, I listened! 👀"<br/>
+    <b>Story 2:</b> [Behind-the-scenes photo/video]<br/>
+    <b>Story 3:</b> "I'm preparing something VERY special for you..."<br/>
+    <b>Story 4:</b> "Want to know first? Send me a 🔥 and I'll let you know!"<br/>
+    <b>Story 5:</b> Poll: "Which topic do you want me to cover first?"
+    """,
+                    },
+                    {
+                        'title': "📱 Template 5: Flash Sale",
+                        'body': """
+    ⚡ FLASH SALE ⚡<br/><br/>
+    Only for the next [X] hours!<br/><br/>
+    [PRODUCT NAME] with [X]% OFF<br/><br/>
+    From R$[FULL PRICE]<br/>
+    For only R$[DISCOUNTED PRICE]<br/><br/>
+    + Exclusive bonus: [BONUS NAME]<br/><br/>
+    ⏰ Ends today at [TIME]<br/><br/>
+    Hurry! Link in bio ⬆️
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "5. SALES VIDEO SCRIPTS",
+                'models': [
+                    {
+                        'title': "🎬 Template 1: Short VSL (3-5 min)",
+                        'body': """
+    <b>[HOOK - 0:00 to 0:15]</b><br/>
+    "If you [PAIN/PROBLEM], this video could change everything for you."<br/><br/>
+
+    <b>[RELATE - 0:15 to 0:45]</b><br/>
+    "I know what it's like to [DESCRIBE THE PAIN]. I've been there too. [YOUR SHORT STORY]"<br/><br/>
+
+    <b>[SOLUTION - 0:45 to 1:30]</b><br/>
+    "After [X TIME/EXPERIENCE], I discovered a method that [RESULT]. And that's exactly what I teach in [PRODUCT NAME]."<br/><br/>
+
+    <b>[WHAT IT IS - 1:30 to 2:30]</b><br/>
+    "[NAME] is [DESCRIPTION]. You will learn:<br/>
+    • [Module/Benefit 1]<br/>
+    • [Module/Benefit 2]<br/>
+    • [Module/Benefit 3]"<br/><br/>
+
+    <b>[DIFFERENTIATOR - 2:30 to 3:00]</b><br/>
+    "And the best part: all of this in an EXCLUSIVE APP with my brand. You access it from your phone, get notifications, join the community..."<br/><br/>
+
+    <b>[PROOF - 3:00 to 3:30]</b><br/>
+    "See what students are saying: [TESTIMONIALS]"<br/><br/>
+
+    <b>[OFFER - 3:30 to 4:00]</b><br/>
+    "Normally the investment would be R$[HIGH PRICE]. But today, you get all of this for only R$[PRICE]. Plus you get [BONUS]."<br/><br/>
+
+    <b>[CTA - 4:00 to 4:30]</b><br/>
+    "Click the button below and secure your spot now. Remember: you have a [X]-day guarantee. If you don't like it, I'll refund your money."<br/><br/>
+
+    <b>[URGENCY - 4:30 to 5:00]</b><br/>
+    "This special deal is for a limited time. Don't put it off. Click now and start your transformation today!"
+    """,
+                    },
+                    {
+                        'title': "🎬 Template 2: Welcome Video (App)",
+                        'body': """
+    <b>[OPENING - 0:00 to 0:10]</b><br/>
+    "Hey! Welcome to your app! So glad to have you here!"<br/><br/>
+
+    <b>[ORIENTATION - 0:10 to 0:40]</b><br/>
+    "Let me quickly show you how it works:<br/>
+    • Down here you have the main menu<br/>
+    • In 'Lessons' you'll find all the content<br/>
+    • In 'Community' you can interact with other students<br/>
+    • And in 'Profile' you track your progress"<br/><br/>
+
+    <b>[FIRST STEP - 0:40 to 1:00]</b><br/>
+    "My suggestion: start with the lesson '[FIRST LESSON NAME]'. It takes only [X] minutes and will give you the foundation for everything else."<br/><br/>
+
+    <b>[CLOSING - 1:00 to 1:15]</b><br/>
+    "Any questions, reach out in the community or to support. Ready to start? See you in the first lesson!"
+    """,
+                    },
+                ],
+            },
+        ],
+        'closing': {
+            'title': "🎉 CONGRATULATIONS!",
+            'subtitle': "You now have tested and proven templates in your hands.",
+            'body': "Now just customize them and put them to work!",
+        },
+    },
+
+    # Launch Guide
+    'guia': {
+        'title': "🚀 LAUNCH GUIDE",
+        'subtitle': "Step by step to launch your app successfully",
+        'price': "R$147",
+        'overview_title': "📋 LAUNCH OVERVIEW",
+        'overview_body': """
+    This guide takes you from zero to a published app in 7 simple stages.
+    Follow them in order and you'll have your app up and selling in a few days!
+    """,
+        'steps_title': "The 7 Stages:",
+        'steps': [
+            "1. Preparation (Day 1)",
+            "2. App Setup (Day 1-2)",
+            "3. Content Upload (Day 2-3)",
+            "4. Payment Integration (Day 3)",
+            "5. Testing (Day 4)",
+            "6. Pre-launch (Day 5-6)",
+            "7. Launch! (Day 7)",
+        ],
+        'stages': [
+            {
+                'title': "STAGE 1: PREPARATION",
+                'lead': "⏱️ Estimated time: 2-3 hours",
+                'blocks': [
+                    ('h2', "What you need to have ready:"),
+                    ('checks', [
+                        "Your brand logo (PNG, transparent background, at least 512x512px)",
+                        "Your brand colors (hex code, e.g. #2563EB)",
+                        "App name (short, memorable)",
+                        "Short description (1 sentence about what it is)",
+                        "Your content organized (lessons, PDFs, etc)",
+                    ]),
+                    ('h2', "Content checklist:"),
+                    ('boxes', [
+                        "How many modules will you have?",
+                        "How many lessons per module?",
+                        "Videos already recorded and edited?",
+                        "PDFs/support materials ready?",
+                        "Lesson thumbnails?",
+                    ]),
+                    ('tip', "💡 Tip: You don't need EVERYTHING ready. Start with at least the first module complete."),
+                ],
+            },
+            {
+                'title': "STAGE 2: APP SETUP",
+                'lead': "⏱️ Estimated time: 30-60 minutes",
+                'blocks': [
+                    ('h2', "Step by step:"),
+                    ('body', """
+    <b>1. Open your TribeBuild dashboard</b><br/>
+    → Go to "My Apps" → "Create New App"<br/><br/>
+
+    <b>2. Basic information</b><br/>
+    → App name<br/>
+    → Short description<br/>
+    → Category (education, fitness, etc)<br/><br/>
+
+    <b>3. Visual identity</b><br/>
+    → Logo upload<br/>
+    → Primary color (your blue/green/etc)<br/>
+    → Secondary color (for highlights)<br/><br/>
+
+    <b>4. Advanced settings</b><br/>
+    → Main language<br/>
+    → Timezone<br/>
+    → Custom domain (optional)
+    """),
+                    ('tip', "💡 Tip: Use colors that match your existing brand. Consistency builds trust!"),
+                ],
+            },
+            {
+                'title': "STAGE 3: CONTENT UPLOAD",
+                'lead': "⏱️ Estimated time: 2-4 hours (depends on the amount)",
+                'blocks': [
+                    ('h2', "Recommended structure:"),
+                    ('body', """
+    <b>Welcome Module (required)</b><br/>
+    → Welcome video (1-2 min)<br/>
+    → How to use the app (1-2 min)<br/>
+    → What to expect from the course<br/><br/>
+
+    <b>Content Modules</b><br/>
+    → 3-7 lessons per module (ideal)<br/>
+    → 5-15 minute lessons (better retention)<br/>
+    → Support material when relevant<br/><br/>
+
+    <b>Bonus Module (optional, but powerful)</b><br/>
+    → Exclusive extra content<br/>
+    → Templates, checklists, etc<br/>
+    → Increases perceived value!
+    """),
+                    ('h2', "Upload best practices:"),
+                    ('checks', [
+                        "Name files clearly (e.g. 01-introduction.mp4)",
+                        "Use attractive thumbnails",
+                        "Write descriptions that spark curiosity",
+                        "Mark free lessons as 'preview' to attract leads",
+                    ]),
+                ],
+            },
+            {
+                'title': "STAGE 4: PAYMENT INTEGRATION",
+                'lead': "⏱️ Estimated time: 15-30 minutes",
+                'blocks': [
+                    ('h2', "How to connect your platform:"),
+                    ('integrations', None),
+                    ('body', """
+    <b>In TribeBuild:</b><br/>
+    1. Go to "Integrations"<br/>
+    2. Choose your platform (Kiwify, Hotmart, Eduzz, etc)<br/>
+    3. Copy the Webhook URL<br/><br/>
+
+    <b>In your payment platform:</b><br/>
+    1. Open the product settings<br/>
+    2. Look for "Webhook" or "Postback"<br/>
+    3. Paste the TribeBuild URL<br/>
+    4. Save<br/><br/>
+
+    <b>Test:</b><br/>
+    1. Make a test purchase (or ask someone to)<br/>
+    2. Check that access was unlocked automatically<br/>
+    3. If it doesn't work, check the URL and try again
+    """),
+                    ('tip', "💡 Tip: Most platforms process the webhook within seconds. If it takes more than 5 minutes, something is wrong."),
+                ],
+            },
+            {
+                'title': "STAGE 5: TESTING",
+                'lead': "⏱️ Estimated time: 1-2 hours",
+                'blocks': [
+                    ('h2', "Testing checklist:"),
+                    ('body', """
+    <b>Access:</b><br/>
+    □ Does login work?<br/>
+    □ Does password recovery work?<br/>
+    □ Can a new user sign up?<br/><br/>
+
+    <b>Content:</b><br/>
+    □ Do all videos load?<br/>
+    □ Do PDFs open correctly?<br/>
+    □ Is the lesson order right?<br/>
+    □ Is progress saved?<br/><br/>
+
+    <b>App:</b><br/>
+    □ Does it install on the home screen (iOS and Android)?<br/>
+    □ Do notifications arrive?<br/>
+    □ Does the community work?<br/>
+    □ Does it look good on different screens?<br/><br/>
+
+    <b>Payment:</b><br/>
+    □ Does a test purchase unlock access?<br/>
+    □ Is the welcome email sent?<br/>
+    □ Can the user log in after purchase?
+    """),
+                    ('tip', "💡 Tip: Ask 2-3 people you trust to test it. Fresh eyes find bugs you don't see."),
+                ],
+            },
+            {
+                'title': "STAGE 6: PRE-LAUNCH",
+                'lead': "⏱️ Estimated time: 2-3 days",
+                'blocks': [
+                    ('h2', "Warming up your audience:"),
+                    ('body', """
+    <b>Day 1 - Curiosity:</b><br/>
+    → Post: "I'm preparing something special..."<br/>
+    → Stories: Behind the scenes without revealing everything<br/>
+    → Goal: Build curiosity<br/><br/>
+
+    <b>Day 2 - Partial reveal:</b><br/>
+    → Reveal what it's about<br/>
+    → Show a preview of the app<br/>
+    → Collect interested people (VIP list)<br/><br/>
+
+    <b>Day 3 - Countdown:</b><br/>
+    → "Opens tomorrow!"<br/>
+    → Show testimonials (if you have beta users)<br/>
+    → Reinforce the launch offer
+    """),
+                    ('h2', "Prepare your materials:"),
+                    ('boxes', [
+                        "Sales page reviewed",
+                        "Launch emails written",
+                        "Social media posts scheduled",
+                        "Launch group/list ready",
+                        "FAQ with objections answered",
+                    ]),
+                ],
+            },
+            {
+                'title': "STAGE 7: LAUNCH! 🚀",
+                'lead': "The big day is here!",
+                'blocks': [
+                    ('h2', "Schedule for the day:"),
+                    ('body', """
+    <b>Morning (8am-9am):</b><br/>
+    → Check that everything is working<br/>
+    → Open the cart/sales<br/>
+    → Send an email to the VIP list<br/><br/>
+
+    <b>Morning (9am-12pm):</b><br/>
+    → Launch post on social media<br/>
+    → Stories in sequence<br/>
+    → Reply to comments quickly<br/><br/>
+
+    <b>Afternoon (2pm-6pm):</b><br/>
+    → More content on social media<br/>
+    → Lives/live videos<br/>
+    → Answer DMs and questions<br/><br/>
+
+    <b>Evening (7pm-10pm):</b><br/>
+    → Final sales push<br/>
+    → Closing reminder (if it's a limited offer)<br/>
+    → Thank everyone who bought
+    """),
+                    ('h2', "After the launch:"),
+                    ('checks', [
+                        "Welcome the new students",
+                        "Send app access instructions",
+                        "Monitor support in the first 48h",
+                        "Ask for feedback and testimonials",
+                        "Celebrate! You deserve it! 🎉",
+                    ]),
+                ],
+            },
+        ],
+        'closing': {
+            'title': "🎉 YOU CAN DO IT!",
+            'subtitle': "Follow the step by step and your app will be live in 7 days.",
+            'body': "Remember: done is better than perfect!",
+        },
+    },
+
+    # Setup Checklist
+    'checklist': {
+        'title': "✅ SETUP CHECKLIST",
+        'subtitle': "Nothing forgotten, everything working",
+        'price': "R$97",
+        'howto_title': "📋 HOW TO USE THIS CHECKLIST",
+        'howto_body': """
+    Print this document or use it on your tablet/computer.<br/><br/>
+    Check off each item as you complete it - the boxes are clickable in any PDF viewer. Save the file to keep your progress.<br/><br/>
+    Don't skip stages - the order matters!<br/><br/>
+    At the end, your app will be 100% set up and ready to welcome students.
+    """,
+        'sections': [
+            {
+                'title': "1️⃣ ACCOUNT AND ACCESS",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Create a TribeBuild account",
+                        "Confirm your email",
+                        "Complete your profile (photo, name, bio)",
+                        "Set up 2FA authentication (security)",
+                        "Store credentials in a safe place",
+                    ]},
+                ],
+            },
+            {
+                'title': "2️⃣ APP CREATION",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Click \"Create New App\"",
+                        "Set the app name",
+                        "Write a short description (up to 100 characters)",
+                        "Write the full description",
+                        "Select the main category",
+                        "Set the default language",
+                    ]},
+                ],
+            },
+            {
+                'title': "3️⃣ VISUAL IDENTITY",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Upload the logo (512x512px minimum, PNG)",
+                        "Upload the app icon (192x192px)",
+                        "Set the primary color (hex code)",
+                        "Set the secondary color",
+                        "Upload the cover image/banner",
+                        "Set up the splash screen",
+                        "Review the preview on different devices",
+                    ]},
+                ],
+            },
+            {
+                'title': "4️⃣ CONTENT STRUCTURE",
+                'groups': [
+                    {'label': "Modules:", 'items': [
+                        "Create the welcome module",
+                        "Create the main content modules",
+                        "Set the module order",
+                        "Add a description to each module",
+                        "Add a thumbnail to each module",
+                    ]},
+                    {'label': "Lessons:", 'items': [
+                        "Upload all video lessons",
+                        "Add descriptive titles",
+                        "Add a description/summary",
+                        "Set the duration of each lesson",
+                        "Mark free lessons (preview)",
+                        "Add supplementary materials",
+                        "Check the lesson order",
+                    ]},
+                ],
+            },
+            {
+                'title': "5️⃣ COMMUNITY (if applicable)",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Enable the community module",
+                        "Create categories/topics",
+                        "Set community rules",
+                        "Create a welcome post",
+                        "Set up notifications",
+                        "Assign moderators (if any)",
+                    ]},
+                ],
+            },
+            {
+                'title': "6️⃣ PAYMENT INTEGRATIONS",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Open the integrations area",
+                        "Select the platform (Kiwify, Hotmart, etc)",
+                        "Copy the webhook URL",
+                        "Paste the webhook into the payment platform",
+                        "Save the settings",
+                        "Make a test purchase",
+                        "Check that access was unlocked",
+                        "Check that the email was sent",
+                    ]},
+                ],
+            },
+            {
+                'title': "7️⃣ NOTIFICATIONS",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Set up the welcome notification",
+                        "Set up the unwatched lessons reminder",
+                        "Set up the new content notification",
+                        "Test sending a notification",
+                        "Check that it arrived on your phone",
+                    ]},
+                ],
+            },
+            {
+                'title': "8️⃣ FINAL TESTS",
+                'groups': [
+                    {'label': "Phone test (iOS):", 'items': [
+                        "Open the app in Safari",
+                        "Add to home screen",
+                        "Open as an app",
+                        "Log in",
+                        "Watch a lesson",
+                        "Check that progress was saved",
+                        "Test a notification",
+                    ]},
+                    {'label': "Phone test (Android):", 'items': [
+                        "Open the app in Chrome",
+                        "Install the app (automatic prompt)",
+                        "Open as an app",
+                        "Log in",
+                        "Watch a lesson",
+                        "Check that progress was saved",
+                        "Test a notification",
+                    ]},
+                    {'label': "Purchase test:", 'items': [
+                        "Make a test purchase",
+                        "Check the automatic unlock",
+                        "Check the welcome email",
+                        "Log in as a new student",
+                    ]},
+                ],
+            },
+            {
+                'title': "9️⃣ PRE-LAUNCH",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Review the sales page",
+                        "Check the payment links",
+                        "Prepare launch emails",
+                        "Prepare social media posts",
+                        "Notify the VIP list",
+                        "Set the opening date and time",
+                        "Set up the launch offer (if any)",
+                    ]},
+                ],
+            },
+            {
+                'title': "🔟 LAUNCH DAY",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Check that everything is working (morning)",
+                        "Open sales/cart",
+                        "Send the launch email",
+                        "Publish posts on social media",
+                        "Monitor sales and access",
+                        "Answer questions quickly",
+                        "Welcome the new students",
+                        "Send access instructions",
+                        "Celebrate! 🎉",
+                    ]},
+                ],
+            },
+        ],
+        'closing': {
+            'title': "✅ CHECKLIST COMPLETE!",
+            'body': """
+    If you checked every item, your app is 100% set up and ready to welcome students!
+    """,
+            'tip': "Keep this checklist - it works for all your future apps too!",
+        },
+    },
+}
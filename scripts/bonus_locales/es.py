@@ -0,0 +1,738 @@
+"""Catálogo es dos PDFs de bônus"""
+
+CATALOG = {
+    'footer': "TribeBuild - Transforma tu conocimiento en una app exclusiva",
+    'page': "Página {page}",
+    'value': "Valor: {price} | Tu bono exclusivo TribeBuild",
+    'made_with': "Hecho con 💙 por TribeBuild",
+    'prepared_for': "Preparado exclusivamente para {name}",
+
+    # Plantillas Listas
+    'templates': {
+        'title': "📋 PLANTILLAS LISTAS",
+        'subtitle': "Copia, pega y personaliza para tu negocio",
+        'price': "R$197",
+        'index_title': "📑 LO QUE VAS A ENCONTRAR",
+        'sections': [
+            {
+                'title': "1. EMAILS DE BIENVENIDA",
+                'models': [
+                    {
+                        'title': "📧 Modelo 1: Bienvenida Cálida",
+                        'body': """
+    <b>Asunto:</b> ¡Bienvenido(a) a la familia [NOMBRE DEL CURSO]! 🎉<br/><br/>
+    ¡Hola, [NOMBRE]!<br/><br/>
+    ¡Qué alegría tenerte aquí! Acabas de dar el primer paso hacia [TRANSFORMACIÓN].<br/><br/>
+    Tu acceso a la app ya está habilitado. Para empezar:<br/>
+    1. Descarga la app: [ENLACE]<br/>
+    2. Inicia sesión con este email<br/>
+    3. Empieza por el módulo "Primeros Pasos"<br/><br/>
+    Cualquier duda, ¡aquí estoy!<br/><br/>
+    Un abrazo,<br/>
+    [TU NOMBRE]
+    """,
+                        'tip': "💡 Consejo: Personaliza el campo [TRANSFORMACIÓN] con el resultado principal de tu curso.",
+                    },
+                    {
+                        'title': "📧 Modelo 2: Orientación Inicial",
+                        'body': """
+    <b>Asunto:</b> ¿Por dónde empezar? Aquí está tu guía rápida<br/><br/>
+    ¡Hola, [NOMBRE]!<br/><br/>
+    Sé que a veces surge la duda: "¿Por dónde empiezo?"<br/><br/>
+    Tranquilo(a), preparé un camino seguro para ti:<br/><br/>
+    📱 <b>PASO 1:</b> Instala la app en la pantalla de inicio de tu celular<br/>
+    📚 <b>PASO 2:</b> Mira la clase "Bienvenida" (5 min)<br/>
+    ✅ <b>PASO 3:</b> Completa el ejercicio del día 1<br/><br/>
+    ¡En 7 días ya vas a ver los primeros resultados!<br/><br/>
+    ¿Vamos?<br/>
+    [TU NOMBRE]
+    """,
+                    },
+                    {
+                        'title': "📧 Modelo 3: Reenganche (7 días)",
+                        'body': """
+    <b>Asunto:</b> [NOMBRE], ¡te extrañamos! 💙<br/><br/>
+    ¡Hola, [NOMBRE]!<br/><br/>
+    Noté que hace algunos días que no entras a la app.<br/><br/>
+    ¿Todo bien? Si tienes alguna dificultad, ¡cuéntame y te ayudo!<br/><br/>
+    Mientras tanto, te dejé una clase especial disponible: [ENLACE DE LA CLASE]<br/><br/>
+    Trata sobre [TEMA INTERESANTE] y dura solo 8 minutos.<br/><br/>
+    ¡Te espero allí!<br/>
+    [TU NOMBRE]
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "2. MENSAJES DE WHATSAPP",
+                'models': [
+                    {
+                        'title': "💬 Modelo 1: Confirmación de Compra",
+                        'body': """
+    🎉 *¡Felicidades por tu decisión, [NOMBRE]!*<br/><br/>
+    ¡Tu acceso a [NOMBRE DEL CURSO] ya está habilitado!<br/><br/>
+    📱 *Próximo paso:*<br/>
+    Entra a la app con este enlace: [ENLACE]<br/><br/>
+    ¡Cualquier duda, escríbeme aquí!<br/><br/>
+    ¡Bienvenido(a) a la familia! 💙
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 2: Recordatorio de Clase",
+                        'body': """
+    ¡Hola, [NOMBRE]! 👋<br/><br/>
+    ¡Solo paso a recordarte que hay una clase nueva en la app!<br/><br/>
+    📚 *[NOMBRE DE LA CLASE]*<br/>
+    ⏱️ Duración: X minutos<br/><br/>
+    Esta clase trata sobre [TEMA] y te va a ayudar a [BENEFICIO].<br/><br/>
+    ¿La vemos? 🚀
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 3: Pedido de Feedback",
+                        'body': """
+    ¡Hola, [NOMBRE]! ¿Cómo estás?<br/><br/>
+    ¡Vi que ya completaste el [X]% del curso! 🎯<br/><br/>
+    Quería saber: ¿qué te está pareciendo hasta ahora?<br/><br/>
+    ¡Tu opinión es súper importante para que yo mejore cada vez más!<br/><br/>
+    ¡Cuéntame! 💙
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 4: Oferta de Upgrade",
+                        'body': """
+    [NOMBRE], ¡tengo una novedad! 🎁<br/><br/>
+    Como eres alumno(a) de [CURSO BÁSICO], habilité una condición especial para ti:<br/><br/>
+    *[NOMBRE DEL UPGRADE]* con *30% OFF*!<br/><br/>
+    ✅ [Beneficio 1]<br/>
+    ✅ [Beneficio 2]<br/>
+    ✅ [Beneficio 3]<br/><br/>
+    Válido solo hasta [FECHA].<br/><br/>
+    ¿Quieres saber más? ¡Escríbeme! 🚀
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 5: Soporte Proactivo",
+                        'body': """
+    ¡Hola, [NOMBRE]! 👋<br/><br/>
+    Paso a ver si todo está bien con tu acceso a la app.<br/><br/>
+    Si tienes cualquier duda sobre:<br/>
+    • Cómo acceder a las clases<br/>
+    • Cómo usar la comunidad<br/>
+    • Cualquier otra cosa<br/><br/>
+    Solo escríbeme, ¿sí? ¡Estoy aquí para ayudarte! 💙
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "3. DESCRIPCIONES DE PRODUCTOS",
+                'models': [
+                    {
+                        'title': "📝 Modelo 1: Curso Online",
+                        'body': """
+    <b>[NOMBRE DEL CURSO]</b><br/><br/>
+    Estás a un paso de [TRANSFORMACIÓN PRINCIPAL].<br/><br/>
+    <b>Lo que vas a aprender:</b><br/>
+    ✅ [Beneficio 1 con resultado específico]<br/>
+    ✅ [Beneficio 2 con resultado específico]<br/>
+    ✅ [Beneficio 3 con resultado específico]<br/>
+    ✅ [Beneficio 4 con resultado específico]<br/><br/>
+    <b>Qué incluye:</b><br/>
+    📱 App exclusiva con tu marca<br/>
+    📚 [X] módulos con [Y] clases<br/>
+    👥 Acceso a la comunidad de alumnos<br/>
+    📲 Notificaciones de nuevos contenidos<br/>
+    🎁 [Bono especial]<br/><br/>
+    <b>Para quién es:</b><br/>
+    • [Perfil 1]<br/>
+    • [Perfil 2]<br/>
+    • [Perfil 3]<br/><br/>
+    <b>Garantía:</b> 7 días para probar. Si no te gusta, te devolvemos tu dinero.
+    """,
+                    },
+                    {
+                        'title': "📝 Modelo 2: Mentoría",
+                        'body': """
+    <b>Mentoría [NOMBRE]</b><br/><br/>
+    Acompañamiento personalizado para que [RESULTADO].<br/><br/>
+    <b>Cómo funciona:</b><br/>
+    🗓️ [X] encuentros en vivo por mes<br/>
+    📱 App exclusiva con todo el contenido<br/>
+    💬 Grupo privado para dudas<br/>
+    📋 Tareas semanales con feedback<br/><br/>
+    <b>Resultados de los mentorados:</b><br/>
+    "[Testimonio 1]" - Nombre<br/>
+    "[Testimonio 2]" - Nombre<br/><br/>
+    <b>Cupos limitados:</b> Solo [X] cupos por grupo.
+    """,
+                    },
+                    {
+                        'title': "📝 Modelo 3: Comunidad/Suscripción",
+                        'body': """
+    <b>Comunidad [NOMBRE]</b><br/><br/>
+    El lugar donde [PÚBLICO OBJETIVO] se conectan para [OBJETIVO COMÚN].<br/><br/>
+    <b>Lo que ganas como miembro:</b><br/>
+    📱 App exclusiva de la comunidad<br/>
+    🔴 Lives semanales sobre [TEMA]<br/>
+    📚 Biblioteca de contenidos<br/>
+    👥 Networking con [X]+ miembros<br/>
+    🎁 Descuentos en productos y eventos<br/><br/>
+    <b>Inversión:</b><br/>
+    Solo R$[X]/mes o R$[Y]/año (ahorro de R$[Z])<br/><br/>
+    <b>Cancela cuando quieras.</b> Sin multa, sin burocracia.
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "4. POSTS PARA REDES SOCIALES",
+                'models': [
+                    {
+                        'title': "📱 Modelo 1: Anuncio de Lanzamiento",
+                        'body': """
+    🚀 ¡ES OFICIAL!<br/><br/>
+    Después de [X meses/años] trabajando en esto, por fin puedo anunciar:<br/><br/>
+    ¡[NOMBRE DEL PRODUCTO] ya está disponible! 🎉<br/><br/>
+    Y lo mejor: ¡ahora accedes a todo desde la APP exclusiva!<br/><br/>
+    📱 Tu celular se convierte en tu aula<br/>
+    🔔 Notificaciones para no perderte nada<br/>
+    👥 Comunidad directo en la app<br/><br/>
+    ¡Enlace en la bio para asegurar tu lugar! ⬆️<br/><br/>
+    #lanzamiento #cursoonline #[tunicho]
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 2: Prueba Social",
+                        'body': """
+    Mira lo que [NOMBRE] me envió hoy 😍<br/><br/>
+    "[Testimonio del alumno con resultado]"<br/><br/>
+    ¡Esto me hace TAN feliz! 💙<br/><br/>
+    Ver a mis alumnos logrando [RESULTADO] es lo que me motiva a seguir.<br/><br/>
+    ¿Quieres ser el(la) próximo(a)?<br/>
+    ¡Enlace en la bio! ⬆️<br/><br/>
+    #resultado #testimonio #transformacion
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 3: Contenido de Valor + CTA",
+                        'body': """
+    3 errores que comete [TU PÚBLICO] y que impiden [RESULTADO]:<br/><br/>
+    ❌ Error 1: [Describe el error]<br/>
+    ✅ Solución: [Da la solución]<br/><br/>
+    ❌ Error 2: [Describe el error]<br/>
+    ✅ Solución: [Da la solución]<br/><br/>
+    ❌ Error 3: [Describe el error]<br/>
+    ✅ Solución: [Da la solución]<br/><br/>
+    ¡Guarda este post! 📌<br/><br/>
+    Y si quieres profundizar, mi curso [NOMBRE] tiene un módulo entero sobre esto.<br/>
+    ¡Enlace en la bio! ⬆️
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 4: Stories - Detrás de Cámaras",
+                        'body': """
+    <b>Story 1:</b> "¡Ustedes lo pidieron, yo los escuché! 👀"<br/>
+    <b>Story 2:</b> [Foto/video detrás de cámaras]<br/>
+    <b>Story 3:</b> "Estoy preparando algo MUY especial para ustedes..."<br/>
+    <b>Story 4:</b> "¿Quieres saberlo primero? ¡Mándame un 🔥 y te aviso!"<br/>
+    <b>Story 5:</b> Encuesta: "¿Qué tema quieren que aborde primero?"
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 5: Oferta Relámpago",
+                        'body': """
+    ⚡ OFERTA RELÁMPAGO ⚡<br/><br/>
+    ¡Solo en las próximas [X] horas!<br/><br/>
+    [NOMBRE DEL PRODUCTO] con [X]% OFF<br/><br/>
+    De R$[PRECIO COMPLETO]<br/>
+    Por solo R$[PRECIO CON DESCUENTO]<br/><br/>
+    + Bono exclusivo: [NOMBRE DEL BONO]<br/><br/>
+    ⏰ Termina hoy a las [HORA]<br/><br/>
+    ¡Corre! Enlace en la bio ⬆️
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "5. GUIONES DE VIDEO DE VENTAS",
+                'models': [
+                    {
+                        'title': "🎬 Modelo 1: VSL Corta (3-5 min)",
+                        'body': """
+    <b>[GANCHO - 0:00 a 0:15]</b><br/>
+    "Si tú [DOLOR/PROBLEMA], este video puede cambiarlo todo para ti."<br/><br/>
+
+    <b>[IDENTIFICACIÓN - 0:15 a 0:45]</b><br/>
+    "Sé lo que es [DESCRIBE EL DOLOR]. Yo también pasé por eso. [TU HISTORIA BREVE]"<br/><br/>
+
+    <b>[SOLUCIÓN - 0:45 a 1:30]</b><br/>
+    "Después de [X TIEMPO/EXPERIENCIA], descubrí un método que [RESULTADO]. Y es exactamente lo que enseño en [NOMBRE DEL PRODUCTO]."<br/><br/>
+
+    <b>[QUÉ ES - 1:30 a 2:30]</b><br/>
+    "[NOMBRE] es [DESCRIPCIÓN]. Vas a aprender:<br/>
+    • [Módulo/Beneficio 1]<br/>
+    • [Módulo/Beneficio 2]<br/>
+    • [Módulo/Beneficio 3]"<br/><br/>
+
+    <b>[DIFERENCIAL - 2:30 a 3:00]</b><br/>
+    "Y lo mejor: todo esto en una APP EXCLUSIVA con mi marca. Accedes desde el celular, recibes notificaciones, participas de la comunidad..."<br/><br/>
+
+    <b>[PRUEBA - 3:00 a 3:30]</b><br/>
+    "Mira lo que dicen los alumnos: [TESTIMONIOS]"<br/><br/>
+
+    <b>[OFERTA - 3:30 a 4:00]</b><br/>
+    "Normalmente la inversión sería de R$[PRECIO ALTO]. Pero hoy te llevas todo esto por solo R$[PRECIO]. Y además ganas [BONO]."<br/><br/>
+
+    <b>[CTA - 4:00 a 4:30]</b><br/>
+    "Haz clic en el botón de abajo y asegura tu lugar ahora. Recuerda: tienes [X] días de garantía. Si no te gusta, te devuelvo tu dinero."<br/><br/>
+
+    <b>[URGENCIA - 4:30 a 5:00]</b><br/>
+    "Esta condición especial es por tiempo limitado. No lo dejes para después. ¡Haz clic ahora y empieza tu transformación hoy!"
+    """,
+                    },
+                    {
+                        'title': "🎬 Modelo 2: Video de Bienvenida (App)",
+                        'body': """
+    <b>[APERTURA - 0:00 a 0:10]</b><br/>
+    "¡Hola! ¡Bienvenido(a) a tu app! ¡Qué bueno tenerte aquí!"<br/><br/>
+
+    <b>[ORIENTACIÓN - 0:10 a 0:40]</b><br/>
+    "Déjame mostrarte rápidamente cómo funciona:<br/>
+    • Aquí abajo tienes el menú principal<br/>
+    • En 'Clases' encuentras todo el contenido<br/>
+    • En 'Comunidad' puedes interactuar con otros alumnos<br/>
+    • Y en 'Perfil' sigues tu progreso"<br/><br/>
+
+    <b>[PRIMER PASO - 0:40 a 1:00]</b><br/>
+    "Mi sugerencia: empieza por la clase '[NOMBRE DE LA PRIMERA CLASE]'. Dura solo [X] minutos y te va a dar la base para todo lo demás."<br/><br/>
+
+    <b>[CIERRE - 1:00 a 1:15]</b><br/>
+    "Cualquier duda, escríbeme en la comunidad o en soporte. ¿Empezamos? ¡Te veo en la primera clase!"
+    """,
+                    },
+                ],
+            },
+        ],
+        'closing': {
+            'title': "🎉 ¡FELICIDADES!",
+            'subtitle': "Tienes en tus manos plantillas probadas y aprobadas.",
+            'body': "¡Ahora solo falta personalizarlas y usarlas!",
+        },
+    },
+
+    # Guía de Lanzamiento
+    'guia': {
+        'title': "🚀 GUÍA DE LANZAMIENTO",
+        'subtitle': "Paso a paso para lanzar tu app con éxito",
+        'price': "R$147",
+        'overview_title': "📋 VISIÓN GENERAL DEL LANZAMIENTO",
+        'overview_body': """
+    Esta guía te lleva de cero a la app publicada en 7 etapas simples.
+    ¡Síguelas en orden y tendrás tu app funcionando y vendiendo en pocos días!
+    """,
+        'steps_title': "Las 7 Etapas:",
+        'steps': [
+            "1. Preparación (Día 1)",
+            "2. Configuración de la App (Día 1-2)",
+            "3. Carga de Contenido (Día 2-3)",
+            "4. Integración de Pagos (Día 3)",
+            "5. Pruebas (Día 4)",
+            "6. Prelanzamiento (Día 5-6)",
+            "7. ¡Lanzamiento! (Día 7)",
+        ],
+        'stages': [
+            {
+                'title': "ETAPA 1: PREPARACIÓN",
+                'lead': "⏱️ Tiempo estimado: 2-3 horas",
+                'blocks': [
+                    ('h2', "Lo que necesitas tener listo:"),
+                    ('checks', [
+                        "Logo de tu marca (PNG, fondo transparente, mínimo 512x512px)",
+                        "Colores de tu marca (código hexadecimal, ej: #2563EB)",
+                        "Nombre de la app (corto, memorable)",
+                        "Descripción corta (1 frase sobre qué es)",
+                        "Tu contenido organizado (clases, PDFs, etc)",
+                    ]),
+                    ('h2', "Checklist de contenido:"),
+                    ('boxes', [
+                        "¿Cuántos módulos vas a tener?",
+                        "¿Cuántas clases por módulo?",
+                        "¿Videos ya grabados y editados?",
+                        "¿PDFs/materiales de apoyo listos?",
+                        "¿Miniaturas de las clases?",
+                    ]),
+                    ('tip', "💡 Consejo: No necesitas tener TODO listo. Empieza con al menos el primer módulo completo."),
+                ],
+            },
+            {
+                'title': "ETAPA 2: CONFIGURACIÓN DE LA APP",
+                'lead': "⏱️ Tiempo estimado: 30-60 minutos",
+                'blocks': [
+                    ('h2', "Paso a paso:"),
+                    ('body', """
+    <b>1. Entra a tu panel TribeBuild</b><br/>
+    → Ve a "Mis Apps" → "Crear Nueva App"<br/><br/>
+
+    <b>2. Información básica</b><br/>
+    → Nombre de la app<br/>
+    → Descripción corta<br/>
+    → Categoría (educación, fitness, etc)<br/><br/>
+
+    <b>3. Identidad visual</b><br/>
+    → Carga del logo<br/>
+    → Color primario (tu azul/verde/etc)<br/>
+    → Color secundario (para destacados)<br/><br/>
+
+    <b>4. Configuraciones avanzadas</b><br/>
+    → Idioma principal<br/>
+    → Zona horaria<br/>
+    → Dominio personalizado (opcional)
+    """),
+                    ('tip', "💡 Consejo: Usa colores que combinen con tu marca actual. ¡La consistencia genera confianza!"),
+                ],
+            },
+            {
+                'title': "ETAPA 3: CARGA DE CONTENIDO",
+                'lead': "⏱️ Tiempo estimado: 2-4 horas (depende de la cantidad)",
+                'blocks': [
+                    ('h2', "Estructura recomendada:"),
+                    ('body', """
+    <b>Módulo de Bienvenida (obligatorio)</b><br/>
+    → Video de bienvenida (1-2 min)<br/>
+    → Cómo usar la app (1-2 min)<br/>
+    → Qué esperar del curso<br/><br/>
+
+    <b>Módulos de Contenido</b><br/>
+    → 3-7 clases por módulo (ideal)<br/>
+    → Clases de 5-15 minutos (mejor retención)<br/>
+    → Material de apoyo cuando sea relevante<br/><br/>
+
+    <b>Módulo Bono (opcional, pero poderoso)</b><br/>
+    → Contenido extra exclusivo<br/>
+    → Plantillas, checklists, etc<br/>
+    → ¡Aumenta el valor percibido!
+    """),
+                    ('h2', "Buenas prácticas para la carga:"),
+                    ('checks', [
+                        "Nombra los archivos de forma clara (ej: 01-introduccion.mp4)",
+                        "Usa miniaturas atractivas",
+                        "Escribe descripciones que generen curiosidad",
+                        "Marca clases gratuitas como 'preview' para atraer leads",
+                    ]),
+                ],
+            },
+            {
+                'title': "ETAPA 4: INTEGRACIÓN DE PAGOS",
+                'lead': "⏱️ Tiempo estimado: 15-30 minutos",
+                'blocks': [
+                    ('h2', "Cómo conectar tu plataforma:"),
+                    ('integrations', None),
+                    ('body', """
+    <b>En TribeBuild:</b><br/>
+    1. Ve a "Integraciones"<br/>
+    2. Elige tu plataforma (Kiwify, Hotmart, Eduzz, etc)<br/>
+    3. Copia la URL del Webhook<br/><br/>
+
+    <b>En tu plataforma de pago:</b><br/>
+    1. Entra a la configuración del producto<br/>
+    2. Busca "Webhook" o "Postback"<br/>
+    3. Pega la URL de TribeBuild<br/>
+    4. Guarda<br/><br/>
+
+    <b>Prueba:</b><br/>
+    1. Haz una compra de prueba (o pídele a alguien)<br/>
+    2. Verifica si el acceso se habilitó automáticamente<br/>
+    3. Si no funciona, revisa la URL e inténtalo de nuevo
+    """),
+                    ('tip', "💡 Consejo: La mayoría de las plataformas procesa el webhook en segundos. Si tarda más de 5 minutos, algo está mal."),
+                ],
+            },
+            {
+                'title': "ETAPA 5: PRUEBAS",
+                'lead': "⏱️ Tiempo estimado: 1-2 horas",
+                'blocks': [
+                    ('h2', "Checklist de pruebas:"),
+                    ('body', """
+    <b>Acceso:</b><br/>
+    □ ¿Funciona el inicio de sesión?<br/>
+    □ ¿Funciona la recuperación de contraseña?<br/>
+    □ ¿Un usuario nuevo puede registrarse?<br/><br/>
+
+    <b>Contenido:</b><br/>
+    □ ¿Cargan todos los videos?<br/>
+    □ ¿Los PDFs abren correctamente?<br/>
+    □ ¿El orden de las clases es correcto?<br/>
+    □ ¿Se guarda el progreso?<br/><br/>
+
+    <b>App:</b><br/>
+    □ ¿Se instala en la pantalla de inicio (iOS y Android)?<br/>
+    □ ¿Llegan las notificaciones?<br/>
+    □ ¿Funciona la comunidad?<br/>
+    □ ¿Se ve bien en diferentes pantallas?<br/><br/>
+
+    <b>Pago:</b><br/>
+    □ ¿La compra de prueba habilita el acceso?<br/>
+    □ ¿Se envía el email de bienvenida?<br/>
+    □ ¿El usuario puede acceder después de la compra?
+    """),
+                    ('tip', "💡 Consejo: Pide a 2-3 personas de confianza que prueben. Ojos nuevos encuentran errores que tú no ves."),
+                ],
+            },
+            {
+                'title': "ETAPA 6: PRELANZAMIENTO",
+                'lead': "⏱️ Tiempo estimado: 2-3 días",
+                'blocks': [
+                    ('h2', "Calentamiento de la audiencia:"),
+                    ('body', """
+    <b>Día 1 - Curiosidad:</b><br/>
+    → Post: "Estoy preparando algo especial..."<br/>
+    → Stories: Detrás de cámaras sin revelar todo<br/>
+    → Objetivo: Generar curiosidad<br/><br/>
+
+    <b>Día 2 - Revelación parcial:</b><br/>
+    → Revela de qué se trata<br/>
+    → Muestra un preview de la app<br/>
+    → Reúne interesados (lista VIP)<br/><br/>
+
+    <b>Día 3 - Cuenta regresiva:</b><br/>
+    → "¡Mañana abre!"<br/>
+    → Muestra testimonios (si tienes betas)<br/>
+    → Refuerza la oferta de lanzamiento
+    """),
+                    ('h2', "Prepara tus materiales:"),
+                    ('boxes', [
+                        "Página de ventas revisada",
+                        "Emails de lanzamiento escritos",
+                        "Posts de redes sociales programados",
+                        "Grupo/lista de lanzamiento lista",
+                        "FAQ con objeciones respondidas",
+                    ]),
+                ],
+            },
+            {
+                'title': "ETAPA 7: ¡LANZAMIENTO! 🚀",
+                'lead': "¡Llegó el gran día!",
+                'blocks': [
+                    ('h2', "Cronograma del día:"),
+                    ('body', """
+    <b>Mañana (8h-9h):</b><br/>
+    → Verifica que todo esté funcionando<br/>
+    → Abre el carrito/ventas<br/>
+    → Envía email a la lista VIP<br/><br/>
+
+    <b>Mañana (9h-12h):</b><br/>
+    → Post de lanzamiento en las redes<br/>
+    → Stories en secuencia<br/>
+    → Responde comentarios rápidamente<br/><br/>
+
+    <b>Tarde (14h-18h):</b><br/>
+    → Más contenido en las redes<br/>
+    → Lives/videos en vivo<br/>
+    → Responde DMs y dudas<br/><br/>
+
+    <b>Noche (19h-22h):</b><br/>
+    → Último empujón de ventas<br/>
+    → Recordatorio de cierre (si es oferta limitada)<br/>
+    → Agradece a quien compró
+    """),
+                    ('h2', "Después del lanzamiento:"),
+                    ('checks', [
+                        "Da la bienvenida a los nuevos alumnos",
+                        "Envía instrucciones de acceso a la app",
+                        "Monitorea el soporte en las primeras 48h",
+                        "Pide feedback y testimonios",
+                        "¡Celebra! ¡Te lo mereces! 🎉",
+                    ]),
+                ],
+            },
+        ],
+        'closing': {
+            'title': "🎉 ¡TÚ PUEDES!",
+            'subtitle': "Sigue el paso a paso y tu app estará disponible en 7 días.",
+            'body': "Recuerda: ¡hecho es mejor que perfecto!",
+        },
+    },
+
+    # Checklist de Configuración
+    'checklist': {
+        'title': "✅ CHECKLIST DE CONFIGURACIÓN",
+        'subtitle': "Nada olvidado, todo funcionando",
+        'price': "R$97",
+        'howto_title': "📋 CÓMO USAR ESTE CHECKLIST",
+        'howto_body': """
+    Imprime este documento o úsalo en la tablet/computadora.<br/><br/>
+    Marca cada ítem a medida que lo completes - las casillas se pueden marcar en cualquier lector de PDF. Guarda el archivo para conservar tu progreso.<br/><br/>
+    No te saltes etapas - ¡el orden importa!<br/><br/>
+    Al final, tendrás tu app 100% configurada y lista para recibir alumnos.
+    """,
+        'sections': [
+            {
+                'title': "1️⃣ CUENTA Y ACCESO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Crear cuenta en TribeBuild",
+                        "Confirmar email",
+                        "Completar perfil (foto, nombre, bio)",
+                        "Configurar autenticación 2FA (seguridad)",
+                        "Guardar credenciales en un lugar seguro",
+                    ]},
+                ],
+            },
+            {
+                'title': "2️⃣ CREACIÓN DE LA APP",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Hacer clic en \"Crear Nueva App\"",
+                        "Definir nombre de la app",
+                        "Escribir descripción corta (hasta 100 caracteres)",
+                        "Escribir descripción completa",
+                        "Seleccionar categoría principal",
+                        "Definir idioma predeterminado",
+                    ]},
+                ],
+            },
+            {
+                'title': "3️⃣ IDENTIDAD VISUAL",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Cargar el logo (512x512px mínimo, PNG)",
+                        "Cargar el ícono de la app (192x192px)",
+                        "Definir color primario (código hex)",
+                        "Definir color secundario",
+                        "Cargar la imagen de portada/banner",
+                        "Configurar splash screen",
+                        "Revisar preview en diferentes dispositivos",
+                    ]},
+                ],
+            },
+            {
+                'title': "4️⃣ ESTRUCTURA DE CONTENIDO",
+                'groups': [
+                    {'label': "Módulos:", 'items': [
+                        "Crear módulo de bienvenida",
+                        "Crear módulos de contenido principal",
+                        "Definir orden de los módulos",
+                        "Agregar descripción en cada módulo",
+                        "Agregar miniatura en cada módulo",
+                    ]},
+                    {'label': "Clases:", 'items': [
+                        "Cargar todas las videoclases",
+                        "Agregar títulos descriptivos",
+                        "Agregar descripción/resumen",
+                        "Definir duración de cada clase",
+                        "Marcar clases gratuitas (preview)",
+                        "Agregar materiales complementarios",
+                        "Verificar orden de las clases",
+                    ]},
+                ],
+            },
+            {
+                'title': "5️⃣ COMUNIDAD (si aplica)",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Activar módulo de comunidad",
+                        "Crear categorías/temas",
+                        "Definir reglas de la comunidad",
+                        "Crear post de bienvenida",
+                        "Configurar notificaciones",
+                        "Definir moderadores (si hay)",
+                    ]},
+                ],
+            },
+            {
+                'title': "6️⃣ INTEGRACIONES DE PAGO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Entrar al área de integraciones",
+                        "Seleccionar plataforma (Kiwify, Hotmart, etc)",
+                        "Copiar URL del webhook",
+                        "Pegar webhook en la plataforma de pago",
+                        "Guardar configuración",
+                        "Hacer compra de prueba",
+                        "Verificar si el acceso fue habilitado",
+                        "Verificar si el email fue enviado",
+                    ]},
+                ],
+            },
+            {
+                'title': "7️⃣ NOTIFICACIONES",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Configurar notificación de bienvenida",
+                        "Configurar recordatorio de clases no vistas",
+                        "Configurar notificación de nuevo contenido",
+                        "Probar envío de notificación",
+                        "Verificar si llegó al celular",
+                    ]},
+                ],
+            },
+            {
+                'title': "8️⃣ PRUEBAS FINALES",
+                'groups': [
+                    {'label': "Prueba en celular (iOS):", 'items': [
+                        "Entrar a la app desde Safari",
+                        "Agregar a la pantalla de inicio",
+                        "Abrir como app",
+                        "Iniciar sesión",
+                        "Ver una clase",
+                        "Verificar si el progreso se guardó",
+                        "Probar notificación",
+                    ]},
+                    {'label': "Prueba en celular (Android):", 'items': [
+                        "Entrar a la app desde Chrome",
+                        "Instalar app (aviso automático)",
+                        "Abrir como app",
+                        "Iniciar sesión",
+                        "Ver una clase",
+                        "Verificar si el progreso se guardó",
+                        "Probar notificación",
+                    ]},
+                    {'label': "Prueba de compra:", 'items': [
+                        "Hacer compra de prueba",
+                        "Verificar habilitación automática",
+                        "Verificar email de bienvenida",
+                        "Entrar como alumno nuevo",
+                    ]},
+                ],
+            },
+            {
+                'title': "9️⃣ PRELANZAMIENTO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Revisar página de ventas",
+                        "Verificar enlaces de pago",
+                        "Preparar emails de lanzamiento",
+                        "Preparar posts de redes sociales",
+                        "Avisar a la lista VIP",
+                        "Definir fecha y hora de apertura",
+                        "Configurar oferta de lanzamiento (si hay)",
+                    ]},
+                ],
+            },
+            {
+                'title': "🔟 DÍA DEL LANZAMIENTO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Verificar que todo esté funcionando (mañana)",
+                        "Abrir ventas/carrito",
+                        "Enviar email de lanzamiento",
+                        "Publicar posts en las redes",
+                        "Monitorear ventas y accesos",
+                        "Responder dudas rápidamente",
+                        "Dar la bienvenida a los nuevos alumnos",
+                        "Enviar instrucciones de acceso",
+                        "¡Celebrar! 🎉",
+                    ]},
+                ],
+            },
+        ],
+        'closing': {
+            'title': "✅ ¡CHECKLIST COMPLETO!",
+            'body': """
+    Si marcaste todos los ítems, ¡tu app está 100% configurada y lista para recibir alumnos!
+    """,
+            'tip': "Guarda este checklist - ¡te sirve para todas tus próximas apps también!",
+        },
+    },
+}
@@ -0,0 +1,741 @@
+"""Catálogo pt-BR dos PDFs de bônus"""
+
+CATALOG = {
+    'footer': "TribeBuild - Transforme seu conhecimento em um app exclusivo",
+    'page': "Página {page}",
+    'value': "Valor: {price} | Seu bônus exclusivo TribeBuild",
+    'made_with': "Feito com 💙 pelo TribeBuild",
+    'prepared_for': "Preparado exclusivamente para {name}",
+
+    # Templates Prontos
+    'templates': {
+        'title': "📋 TEMPLATES PRONTOS",
+        'subtitle': "Copie, cole e personalize para seu negócio",
+        'price': "R$197",
+        'index_title': "📑 O QUE VOCÊ VAI ENCONTRAR",
+        'sections': [
+            {
+                'title': "1. EMAILS DE BOAS-VINDAS",
+                'models': [
+                    {
+                        'title': "📧 Modelo 1: Boas-vindas Calorosas",
+                        'body': """
+    <b>Assunto:</b> Bem-vindo(a) à família [NOME DO CURSO]! 🎉<br/><br/>
+    Olá, [NOME]!<br/><br/>
+    Que alegria ter você aqui! Você acabou de dar o primeiro passo para [TRANSFORMAÇÃO].<br/><br/>
+    Seu acesso ao app já está liberado. Para começar:<br/>
+    1. Baixe o app: [LINK]<br/>
+    2. Faça login com este email<br/>
+    3. Comece pelo módulo "Primeiros Passos"<br/><br/>
+    Qualquer dúvida, estou aqui!<br/><br/>
+    Um abraço,<br/>
+    [SEU NOME]
+    """,
+                        'tip': "💡 Dica: Personalize o campo [TRANSFORMAÇÃO] com o resultado principal do seu curso.",
+                    },
+                    {
+                        'title': "📧 Modelo 2: Orientação de Início",
+                        'body': """
+    <b>Assunto:</b> Por onde começar? Seu guia rápido está aqui<br/><br/>
+    E aí, [NOME]!<br/><br/>
+    Sei que às vezes bate aquela dúvida: "Por onde começo?"<br/><br/>
+    Relaxa, preparei um caminho certeiro pra você:<br/><br/>
+    📱 <b>PASSO 1:</b> Instale o app na tela inicial do seu celular<br/>
+    📚 <b>PASSO 2:</b> Assista a aula "Bem-vindo" (5 min)<br/>
+    ✅ <b>PASSO 3:</b> Complete o exercício do dia 1<br/><br/>
+    Em 7 dias você já vai ver os primeiros resultados!<br/><br/>
+    Bora?<br/>
+    [SEU NOME]
+    """,
+                    },
+                    {
+                        'title': "📧 Modelo 3: Reengajamento (7 dias)",
+                        'body': """
+    <b>Assunto:</b> [NOME], sentimos sua falta! 💙<br/><br/>
+    Oi, [NOME]!<br/><br/>
+    Percebi que faz alguns dias que você não acessa o app.<br/><br/>
+    Tudo bem por aí? Se tiver alguma dificuldade, me conta que eu ajudo!<br/><br/>
+    Enquanto isso, deixei uma aula especial liberada pra você: [LINK DA AULA]<br/><br/>
+    É sobre [TEMA INTERESSANTE] e dura só 8 minutos.<br/><br/>
+    Te espero lá!<br/>
+    [SEU NOME]
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "2. MENSAGENS DE WHATSAPP",
+                'models': [
+                    {
+                        'title': "💬 Modelo 1: Confirmação de Compra",
+                        'body': """
+    🎉 *Parabéns pela sua decisão, [NOME]!*<br/><br/>
+    Seu acesso ao [NOME DO CURSO] já está liberado!<br/><br/>
+    📱 *Próximo passo:*<br/>
+    Acesse o app pelo link: [LINK]<br/><br/>
+    Qualquer dúvida, é só me chamar aqui!<br/><br/>
+    Bem-vindo(a) à família! 💙
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 2: Lembrete de Aula",
+                        'body': """
+    Ei, [NOME]! 👋<br/><br/>
+    Só passando pra lembrar que tem aula nova no app!<br/><br/>
+    📚 *[NOME DA AULA]*<br/>
+    ⏱️ Duração: X minutos<br/><br/>
+    Essa aula é sobre [TEMA] e vai te ajudar a [BENEFÍCIO].<br/><br/>
+    Bora assistir? 🚀
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 3: Pedido de Feedback",
+                        'body': """
+    Oi, [NOME]! Tudo bem?<br/><br/>
+    Vi que você já completou [X]% do curso! 🎯<br/><br/>
+    Queria saber: o que você está achando até agora?<br/><br/>
+    Seu feedback é super importante pra eu melhorar cada vez mais!<br/><br/>
+    Me conta aí! 💙
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 4: Oferta de Upgrade",
+                        'body': """
+    [NOME], tenho uma novidade! 🎁<br/><br/>
+    Como você é aluno(a) do [CURSO BÁSICO], liberei uma condição especial pra você:<br/><br/>
+    *[NOME DO UPGRADE]* com *30% OFF*!<br/><br/>
+    ✅ [Benefício 1]<br/>
+    ✅ [Benefício 2]<br/>
+    ✅ [Benefício 3]<br/><br/>
+    Válido só até [DATA].<br/><br/>
+    Quer saber mais? Me chama! 🚀
+    """,
+                    },
+                    {
+                        'title': "💬 Modelo 5: Suporte Proativo",
+                        'body': """
+    Oi, [NOME]! 👋<br/><br/>
+    Passando pra ver se está tudo ok com seu acesso ao app.<br/><br/>
+    Se tiver qualquer dúvida sobre:<br/>
+    • Como acessar as aulas<br/>
+    • Como usar a comunidade<br/>
+    • Qualquer outra coisa<br/><br/>
+    É só me chamar, tá? Estou aqui pra ajudar! 💙
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "3. DESCRIÇÕES DE PRODUTOS",
+                'models': [
+                    {
+                        'title': "📝 Modelo 1: Curso Online",
+                        'body': """
+    <b>[NOME DO CURSO]</b><br/><br/>
+    Você está a um passo de [TRANSFORMAÇÃO PRINCIPAL].<br/><br/>
+    <b>O que você vai aprender:</b><br/>
+    ✅ [Benefício 1 com resultado específico]<br/>
+    ✅ [Benefício 2 com resultado específico]<br/>
+    ✅ [Benefício 3 com resultado específico]<br/>
+    ✅ [Benefício 4 com resultado específico]<br/><br/>
+    <b>O que está incluso:</b><br/>
+    📱 App exclusivo com sua marca<br/>
+    📚 [X] módulos com [Y] aulas<br/>
+    👥 Acesso à comunidade de alunos<br/>
+    📲 Notificações de novos conteúdos<br/>
+    🎁 [Bônus especial]<br/><br/>
+    <b>Para quem é:</b><br/>
+    • [Perfil 1]<br/>
+    • [Perfil 2]<br/>
+    • [Perfil 3]<br/><br/>
+    <b>Garantia:</b> 7 dias para testar. Se não gostar, devolvemos seu dinheiro.
+    """,
+                    },
+                    {
+                        'title': "📝 Modelo 2: Mentoria",
+                        'body': """
+    <b>Mentoria [NOME]</b><br/><br/>
+    Acompanhamento personalizado para você [RESULTADO].<br/><br/>
+    <b>Como funciona:</b><br/>
+    🗓️ [X] encontros ao vivo por mês<br/>
+    📱 App exclusivo com todo o conteúdo<br/>
+    💬 Grupo privado para dúvidas<br/>
+    📋 Tarefas semanais com feedback<br/><br/>
+    <b>Resultados dos mentorados:</b><br/>
+    "[Depoimento 1]" - Nome<br/>
+    "[Depoimento 2]" - Nome<br/><br/>
+    <b>Vagas limitadas:</b> Apenas [X] vagas por turma.
+    """,
+                    },
+                    {
+                        'title': "📝 Modelo 3: Comunidade/Assinatura",
+                        'body': """
+    <b>Comunidade [NOME]</b><br/><br/>
+    O lugar onde [PÚBLICO-ALVO] se conectam para [OBJETIVO COMUM].<br/><br/>
+    <b>O que você ganha como membro:</b><br/>
+    📱 App exclusivo da comunidade<br/>
+    🔴 Lives semanais sobre [TEMA]<br/>
+    📚 Biblioteca de conteúdos<br/>
+    👥 Networking com [X]+ membros<br/>
+    🎁 Descontos em produtos e eventos<br/><br/>
+    <b>Investimento:</b><br/>
+    Apenas R$[X]/mês ou R$[Y]/ano (economia de R$[Z])<br/><br/>
+    <b>Cancele quando quiser.</b> Sem multa, sem burocracia.
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "4. POSTS PARA REDES SOCIAIS",
+                'models': [
+                    {
+                        'title': "📱 Modelo 1: Anúncio de Lançamento",
+                        'body': """
+    🚀 É OFICIAL!<br/><br/>
+    Depois de [X meses/anos] trabalhando nisso, finalmente posso anunciar:<br/><br/>
+    [NOME DO PRODUTO] está no ar! 🎉<br/><br/>
+    E o melhor: agora você acessa tudo pelo APP exclusivo!<br/><br/>
+    📱 Seu celular vira sua sala de aula<br/>
+    🔔 Notificações para nunca perder nada<br/>
+    👥 Comunidade direto no app<br/><br/>
+    Link na bio para garantir sua vaga! ⬆️<br/><br/>
+    #lancamento #cursonline #[suanicho]
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 2: Prova Social",
+                        'body': """
+    Olha o que a [NOME] me mandou hoje 😍<br/><br/>
+    "[Depoimento do aluno com resultado]"<br/><br/>
+    Isso me deixa TÃO feliz! 💙<br/><br/>
+    Ver meus alunos conquistando [RESULTADO] é o que me motiva a continuar.<br/><br/>
+    Quer ser o(a) próximo(a)?<br/>
+    Link na bio! ⬆️<br/><br/>
+    #resultado #depoimento #transformacao
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 3: Conteúdo de Valor + CTA",
+                        'body': """
+    3 erros que [SEU PÚBLICO] comete e que impedem [RESULTADO]:<br/><br/>
+    ❌ Erro 1: [Descreva o erro]<br/>
+    ✅ Solução: [Dê a solução]<br/><br/>
+    ❌ Erro 2: [Descreva o erro]<br/>
+    ✅ Solução: [Dê a solução]<br/><br/>
+    ❌ Erro 3: [Descreva o erro]<br/>
+    ✅ Solução: [Dê a solução]<br/><br/>
+    Salva esse post! 📌<br/><br/>
+    E se quiser ir mais fundo, meu curso [NOME] tem um módulo inteiro sobre isso.<br/>
+    Link na bio! ⬆️
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 4: Stories - Bastidores",
+                        'body': """
+    <b>Story 1:</b> "Vocês pediram, eu ouvi! 👀"<br/>
+    <b>Story 2:</b> [Foto/vídeo dos bastidores]<br/>
+    <b>Story 3:</b> "Estou preparando algo MUITO especial pra vocês..."<br/>
+    <b>Story 4:</b> "Quer saber primeiro? Me manda um 🔥 que eu te aviso!"<br/>
+    <b>Story 5:</b> Enquete: "Qual tema vocês querem que eu aborde primeiro?"
+    """,
+                    },
+                    {
+                        'title': "📱 Modelo 5: Oferta Relâmpago",
+                        'body': """
+    ⚡ OFERTA RELÂMPAGO ⚡<br/><br/>
+    Só nas próximas [X] horas!<br/><br/>
+    [NOME DO PRODUTO] com [X]% OFF<br/><br/>
+    De R$[PREÇO CHEIO]<br/>
+    Por apenas R$[PREÇO COM DESCONTO]<br/><br/>
+    + Bônus exclusivo: [NOME DO BÔNUS]<br/><br/>
+    ⏰ Termina hoje às [HORÁRIO]<br/><br/>
+    Corre! Link na bio ⬆️
+    """,
+                    },
+                ],
+            },
+            {
+                'title': "5. SCRIPTS DE VÍDEO DE VENDAS",
+                'models': [
+                    {
+                        'title': "🎬 Modelo 1: VSL Curta (3-5 min)",
+                        'body': """
+    <b>[GANCHO - 0:00 a 0:15]</b><br/>
+    "Se você [DOR/PROBLEMA], esse vídeo pode mudar tudo pra você."<br/><br/>
+
+    <b>[IDENTIFICAÇÃO - 0:15 a 0:45]</b><br/>
+    "Eu sei como é [DESCREVA A DOR]. Eu também já passei por isso. [SUA HISTÓRIA BREVE]"<br/><br/>
+
+    <b>[SOLUÇÃO - 0:45 a 1:30]</b><br/>
+    "Depois de [X TEMPO/EXPERIÊNCIA], descobri um método que [RESULTADO]. E é exatamente isso que eu ensino no [NOME DO PRODUTO]."<br/><br/>
+
+    <b>[O QUE É - 1:30 a 2:30]</b><br/>
+    "O [NOME] é [DESCRIÇÃO]. Você vai aprender:<br/>
+    • [Módulo/Benefício 1]<br/>
+    • [Módulo/Benefício 2]<br/>
+    • [Módulo/Benefício 3]"<br/><br/>
+
+    <b>[DIFERENCIAL - 2:30 a 3:00]</b><br/>
+    "E o melhor: tudo isso em um APP EXCLUSIVO com a minha marca. Você acessa do celular, recebe notificações, participa da comunidade..."<br/><br/>
+
+    <b>[PROVA - 3:00 a 3:30]</b><br/>
+    "Veja o que os alunos estão falando: [DEPOIMENTOS]"<br/><br/>
+
+    <b>[OFERTA - 3:30 a 4:00]</b><br/>
+    "Normalmente o investimento seria R$[PREÇO ALTO]. Mas hoje, você leva tudo isso por apenas R$[PREÇO]. E ainda ganha [BÔNUS]."<br/><br/>
+
+    <b>[CTA - 4:00 a 4:30]</b><br/>
+    "Clica no botão abaixo e garante sua vaga agora. Lembre-se: você tem [X] dias de garantia. Se não gostar, devolvo seu dinheiro."<br/><br/>
+
+    <b>[URGÊNCIA - 4:30 a 5:00]</b><br/>
+    "Essa condição especial é por tempo limitado. Não deixa pra depois. Clica agora e começa sua transformação hoje!"
+    """,
+                    },
+                    {
+                        'title': "🎬 Modelo 2: Vídeo de Boas-Vindas (App)",
+                        'body': """
+    <b>[ABERTURA - 0:00 a 0:10]</b><br/>
+    "E aí! Bem-vindo(a) ao seu app! Que bom ter você aqui!"<br/><br/>
+
+    <b>[ORIENTAÇÃO - 0:10 a 0:40]</b><br/>
+    "Deixa eu te mostrar rapidinho como funciona:<br/>
+    • Aqui embaixo você tem o menu principal<br/>
+    • Em 'Aulas' você encontra todo o conteúdo<br/>
+    • Em 'Comunidade' você pode interagir com outros alunos<br/>
+    • E em 'Perfil' você acompanha seu progresso"<br/><br/>
+
+    <b>[PRIMEIRO PASSO - 0:40 a 1:00]</b><br/>
+    "Minha sugestão: comece pela aula '[NOME DA PRIMEIRA AULA]'. Ela dura só [X] minutos e vai te dar a base pra todo o resto."<br/><br/>
+
+    <b>[ENCERRAMENTO - 1:00 a 1:15]</b><br/>
+    "Qualquer dúvida, me chama lá na comunidade ou no suporte. Bora começar? Te vejo na primeira aula!"
+    """,
+                    },
+                ],
+            },
+        ],
+        'closing': {
+            'title': "🎉 PARABÉNS!",
+            'subtitle': "Você tem em mãos templates testados e aprovados.",
+            'body': "Agora é só personalizar e usar!",
+        },
+    },
+
+    # Guia de Lançamento
+    'guia': {
+        'title': "🚀 GUIA DE LANÇAMENTO",
+        'subtitle': "Passo a passo para lançar seu app com sucesso",
+        'price': "R$147",
+        'overview_title': "📋 VISÃO GERAL DO LANÇAMENTO",
+        'overview_body': """
+    Este guia vai te levar do zero ao app publicado em 7 etapas simples.
+    Siga na ordem e você terá seu app funcionando e vendendo em poucos dias!
+    """,
+        'steps_title': "As 7 Etapas:",
+        'steps': [
+            "1. Preparação (Dia 1)",
+            "2. Configuração do App (Dia 1-2)",
+            "3. Upload de Conteúdo (Dia 2-3)",
+            "4. Integração de Pagamentos (Dia 3)",
+            "5. Testes (Dia 4)",
+            "6. Pré-lançamento (Dia 5-6)",
+            "7. Lançamento! (Dia 7)",
+        ],
+        # Blocos: ('h2', texto), ('body', texto), ('checks', [itens ✅]),
+        # ('boxes', [itens □]), ('tip', texto) e ('integrations', None) - logos das plataformas
+        'stages': [
+            {
+                'title': "ETAPA 1: PREPARAÇÃO",
+                'lead': "⏱️ Tempo estimado: 2-3 horas",
+                'blocks': [
+                    ('h2', "O que você precisa ter pronto:"),
+                    ('checks', [
+                        "Logo da sua marca (PNG, fundo transparente, mínimo 512x512px)",
+                        "Cores da sua marca (código hexadecimal, ex: #2563EB)",
+                        "Nome do app (curto, memorável)",
+                        "Descrição curta (1 frase sobre o que é)",
+                        "Seu conteúdo organizado (aulas, PDFs, etc)",
+                    ]),
+                    ('h2', "Checklist de conteúdo:"),
+                    ('boxes', [
+                        "Quantos módulos você terá?",
+                        "Quantas aulas por módulo?",
+                        "Vídeos já gravados e editados?",
+                        "PDFs/materiais de apoio prontos?",
+                        "Thumbnails das aulas?",
+                    ]),
+                    ('tip', "💡 Dica: Não precisa ter TUDO pronto. Comece com pelo menos o primeiro módulo completo."),
+                ],
+            },
+            {
+                'title': "ETAPA 2: CONFIGURAÇÃO DO APP",
+                'lead': "⏱️ Tempo estimado: 30-60 minutos",
+                'blocks': [
+                    ('h2', "Passo a passo:"),
+                    ('body', """
+    <b>1. Acesse seu painel TribeBuild</b><br/>
+    → Vá em "Meus Apps" → "Criar Novo App"<br/><br/>
+
+    <b>2. Informações básicas</b><br/>
+    → Nome do app<br/>
+    → Descrição curta<br/>
+    → Categoria (educação, fitness, etc)<br/><br/>
+
+    <b>3. Identidade visual</b><br/>
+    → Upload do logo<br/>
+    → Cor primária (seu azul/verde/etc)<br/>
+    → Cor secundária (para destaques)<br/><br/>
+
+    <b>4. Configurações avançadas</b><br/>
+    → Idioma principal<br/>
+    → Timezone<br/>
+    → Domínio personalizado (opcional)
+    """),
+                    ('tip', "💡 Dica: Use cores que combinem com sua marca existente. Consistência gera confiança!"),
+                ],
+            },
+            {
+                'title': "ETAPA 3: UPLOAD DE CONTEÚDO",
+                'lead': "⏱️ Tempo estimado: 2-4 horas (depende da quantidade)",
+                'blocks': [
+                    ('h2', "Estrutura recomendada:"),
+                    ('body', """
+    <b>Módulo de Boas-Vindas (obrigatório)</b><br/>
+    → Vídeo de boas-vindas (1-2 min)<br/>
+    → Como usar o app (1-2 min)<br/>
+    → O que esperar do curso<br/><br/>
+
+    <b>Módulos de Conteúdo</b><br/>
+    → 3-7 aulas por módulo (ideal)<br/>
+    → Aulas de 5-15 minutos (melhor retenção)<br/>
+    → Material de apoio quando relevante<br/><br/>
+
+    <b>Módulo Bônus (opcional, mas poderoso)</b><br/>
+    → Conteúdo extra exclusivo<br/>
+    → Templates, checklists, etc<br/>
+    → Aumenta valor percebido!
+    """),
+                    ('h2', "Boas práticas para upload:"),
+                    ('checks', [
+                        "Nomeie os arquivos de forma clara (ex: 01-introducao.mp4)",
+                        "Use thumbnails atraentes",
+                        "Escreva descrições que gerem curiosidade",
+                        "Marque aulas gratuitas como 'preview' para atrair leads",
+                    ]),
+                ],
+            },
+            {
+                'title': "ETAPA 4: INTEGRAÇÃO DE PAGAMENTOS",
+                'lead': "⏱️ Tempo estimado: 15-30 minutos",
+                'blocks': [
+                    ('h2', "Como conectar sua plataforma:"),
+                    ('integrations', None),
+                    ('body', """
+    <b>No TribeBuild:</b><br/>
+    1. Vá em "Integrações"<br/>
+    2. Escolha sua plataforma (Kiwify, Hotmart, Eduzz, etc)<br/>
+    3. Copie a URL do Webhook<br/><br/>
+
+    <b>Na sua plataforma de pagamento:</b><br/>
+    1. Acesse configurações do produto<br/>
+    2. Procure "Webhook" ou "Postback"<br/>
+    3. Cole a URL do TribeBuild<br/>
+    4. Salve<br/><br/>
+
+    <b>Teste:</b><br/>
+    1. Faça uma compra teste (ou peça para alguém)<br/>
+    2. Verifique se o acesso foi liberado automaticamente<br/>
+    3. Se não funcionar, verifique a URL e tente novamente
+    """),
+                    ('tip', "💡 Dica: A maioria das plataformas processa o webhook em segundos. Se demorar mais de 5 minutos, algo está errado."),
+                ],
+            },
+            {
+                'title': "ETAPA 5: TESTES",
+                'lead': "⏱️ Tempo estimado: 1-2 horas",
+                'blocks': [
+                    ('h2', "Checklist de testes:"),
+                    ('body', """
+    <b>Acesso:</b><br/>
+    □ Login funciona?<br/>
+    □ Recuperação de senha funciona?<br/>
+    □ Novo usuário consegue se cadastrar?<br/><br/>
+
+    <b>Conteúdo:</b><br/>
+    □ Todos os vídeos carregam?<br/>
+    □ PDFs abrem corretamente?<br/>
+    □ Ordem das aulas está certa?<br/>
+    □ Progresso é salvo?<br/><br/>
+
+    <b>App:</b><br/>
+    □ Instala na tela inicial (iOS e Android)?<br/>
+    □ Notificações chegam?<br/>
+    □ Comunidade funciona?<br/>
+    □ Visual está bonito em diferentes telas?<br/><br/>
+
+    <b>Pagamento:</b><br/>
+    □ Compra teste libera acesso?<br/>
+    □ Email de boas-vindas é enviado?<br/>
+    □ Usuário consegue acessar após compra?
+    """),
+                    ('tip', "💡 Dica: Peça para 2-3 pessoas de confiança testarem. Olhos frescos encontram bugs que você não vê."),
+                ],
+            },
+            {
+                'title': "ETAPA 6: PRÉ-LANÇAMENTO",
+                'lead': "⏱️ Tempo estimado: 2-3 dias",
+                'blocks': [
+                    ('h2', "Aquecimento da audiência:"),
+                    ('body', """
+    <b>Dia 1 - Curiosidade:</b><br/>
+    → Post: "Estou preparando algo especial..."<br/>
+    → Stories: Bastidores sem revelar tudo<br/>
+    → Objetivo: Gerar curiosidade<br/><br/>
+
+    <b>Dia 2 - Revelação parcial:</b><br/>
+    → Revele do que se trata<br/>
+    → Mostre um preview do app<br/>
+    → Colete interessados (lista VIP)<br/><br/>
+
+    <b>Dia 3 - Contagem regressiva:</b><br/>
+    → "Amanhã abre!"<br/>
+    → Mostre depoimentos (se tiver betas)<br/>
+    → Reforce a oferta de lançamento
+    """),
+                    ('h2', "Prepare seus materiais:"),
+                    ('boxes', [
+                        "Página de vendas revisada",
+                        "Emails de lançamento escritos",
+                        "Posts de redes sociais agendados",
+                        "Grupo/lista de lançamento pronta",
+                        "FAQ com objeções respondidas",
+                    ]),
+                ],
+            },
+            {
+                'title': "ETAPA 7: LANÇAMENTO! 🚀",
+                'lead': "O grande dia chegou!",
+                'blocks': [
+                    ('h2', "Cronograma do dia:"),
+                    ('body', """
+    <b>Manhã (8h-9h):</b><br/>
+    → Verifique se tudo está funcionando<br/>
+    → Abra o carrinho/vendas<br/>
+    → Envie email para lista VIP<br/><br/>
+
+    <b>Manhã (9h-12h):</b><br/>
+    → Post de lançamento nas redes<br/>
+    → Stories em sequência<br/>
+    → Responda comentários rapidamente<br/><br/>
+
+    <b>Tarde (14h-18h):</b><br/>
+    → Mais conteúdo nas redes<br/>
+    → Lives/vídeos ao vivo<br/>
+    → Responda DMs e dúvidas<br/><br/>
+
+    <b>Noite (19h-22h):</b><br/>
+    → Último push de vendas<br/>
+    → Lembrete de encerramento (se for oferta limitada)<br/>
+    → Agradeça quem comprou
+    """),
+                    ('h2', "Após o lançamento:"),
+                    ('checks', [
+                        "Dê as boas-vindas aos novos alunos",
+                        "Envie instruções de acesso ao app",
+                        "Monitore o suporte nas primeiras 48h",
+                        "Peça feedback e depoimentos",
+                        "Comemore! Você merece! 🎉",
+                    ]),
+                ],
+            },
+        ],
+        'closing': {
+            'title': "🎉 VOCÊ CONSEGUE!",
+            'subtitle': "Siga o passo a passo e seu app estará no ar em 7 dias.",
+            'body': "Lembre-se: feito é melhor que perfeito!",
+        },
+    },
+
+    # Checklist de Configuração
+    'checklist': {
+        'title': "✅ CHECKLIST DE CONFIGURAÇÃO",
+        'subtitle': "Nada esquecido, tudo funcionando",
+        'price': "R$97",
+        'howto_title': "📋 COMO USAR ESTE CHECKLIST",
+        'howto_body': """
+    Imprima este documento ou use no tablet/computador.<br/><br/>
+    Marque cada item conforme for completando - as caixas são clicáveis em qualquer leitor de PDF. Salve o arquivo para guardar seu progresso.<br/><br/>
+    Não pule etapas - a ordem importa!<br/><br/>
+    Ao final, você terá seu app 100% configurado e pronto para receber alunos.
+    """,
+        # Cada seção tem grupos de itens; 'label' é o subtítulo opcional do grupo
+        'sections': [
+            {
+                'title': "1️⃣ CONTA E ACESSO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Criar conta no TribeBuild",
+                        "Confirmar email",
+                        "Completar perfil (foto, nome, bio)",
+                        "Configurar autenticação 2FA (segurança)",
+                        "Salvar credenciais em local seguro",
+                    ]},
+                ],
+            },
+            {
+                'title': "2️⃣ CRIAÇÃO DO APP",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Clicar em \"Criar Novo App\"",
+                        "Definir nome do app",
+                        "Escrever descrição curta (até 100 caracteres)",
+                        "Escrever descrição completa",
+                        "Selecionar categoria principal",
+                        "Definir idioma padrão",
+                    ]},
+                ],
+            },
+            {
+                'title': "3️⃣ IDENTIDADE VISUAL",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Upload do logo (512x512px mínimo, PNG)",
+                        "Upload do ícone do app (192x192px)",
+                        "Definir cor primária (código hex)",
+                        "Definir cor secundária",
+                        "Upload da imagem de capa/banner",
+                        "Configurar splash screen",
+                        "Revisar preview em diferentes dispositivos",
+                    ]},
+                ],
+            },
+            {
+                'title': "4️⃣ ESTRUTURA DE CONTEÚDO",
+                'groups': [
+                    {'label': "Módulos:", 'items': [
+                        "Criar módulo de boas-vindas",
+                        "Criar módulos de conteúdo principal",
+                        "Definir ordem dos módulos",
+                        "Adicionar descrição em cada módulo",
+                        "Adicionar thumbnail em cada módulo",
+                    ]},
+                    {'label': "Aulas:", 'items': [
+                        "Upload de todas as videoaulas",
+                        "Adicionar títulos descritivos",
+                        "Adicionar descrição/resumo",
+                        "Definir duração de cada aula",
+                        "Marcar aulas gratuitas (preview)",
+                        "Adicionar materiais complementares",
+                        "Verificar ordem das aulas",
+                    ]},
+                ],
+            },
+            {
+                'title': "5️⃣ COMUNIDADE (se aplicável)",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Ativar módulo de comunidade",
+                        "Criar categorias/tópicos",
+                        "Definir regras da comunidade",
+                        "Criar post de boas-vindas",
+                        "Configurar notificações",
+                        "Definir moderadores (se houver)",
+                    ]},
+                ],
+            },
+            {
+                'title': "6️⃣ INTEGRAÇÕES DE PAGAMENTO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Acessar área de integrações",
+                        "Selecionar plataforma (Kiwify, Hotmart, etc)",
+                        "Copiar URL do webhook",
+                        "Colar webhook na plataforma de pagamento",
+                        "Salvar configuração",
+                        "Fazer compra teste",
+                        "Verificar se acesso foi liberado",
+                        "Verificar se email foi enviado",
+                    ]},
+                ],
+            },
+            {
+                'title': "7️⃣ NOTIFICAÇÕES",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Configurar notificação de boas-vindas",
+                        "Configurar lembrete de aulas não assistidas",
+                        "Configurar notificação de novo conteúdo",
+                        "Testar envio de notificação",
+                        "Verificar se chegou no celular",
+                    ]},
+                ],
+            },
+            {
+                'title': "8️⃣ TESTES FINAIS",
+                'groups': [
+                    {'label': "Teste no celular (iOS):", 'items': [
+                        "Acessar app pelo Safari",
+                        "Adicionar à tela inicial",
+                        "Abrir como app",
+                        "Fazer login",
+                        "Assistir uma aula",
+                        "Verificar se progresso salvou",
+                        "Testar notificação",
+                    ]},
+                    {'label': "Teste no celular (Android):", 'items': [
+                        "Acessar app pelo Chrome",
+                        "Instalar app (prompt automático)",
+                        "Abrir como app",
+                        "Fazer login",
+                        "Assistir uma aula",
+                        "Verificar se progresso salvou",
+                        "Testar notificação",
+                    ]},
+                    {'label': "Teste de compra:", 'items': [
+                        "Fazer compra teste",
+                        "Verificar liberação automática",
+                        "Verificar email de boas-vindas",
+                        "Acessar como novo aluno",
+                    ]},
+                ],
+            },
+            {
+                'title': "9️⃣ PRÉ-LANÇAMENTO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Revisar página de vendas",
+                        "Verificar links de pagamento",
+                        "Preparar emails de lançamento",
+                        "Preparar posts de redes sociais",
+                        "Avisar lista VIP",
+                        "Definir data e hora de abertura",
+                        "Configurar oferta de lançamento (se houver)",
+                    ]},
+                ],
+            },
+            {
+                'title': "🔟 DIA DO LANÇAMENTO",
+                'groups': [
+                    {'label': None, 'items': [
+                        "Verificar se tudo está funcionando (manhã)",
+                        "Abrir vendas/carrinho",
+                        "Enviar email de lançamento",
+                        "Publicar posts nas redes",
+                        "Monitorar vendas e acessos",
+                        "Responder dúvidas rapidamente",
+                        "Dar boas-vindas aos novos alunos",
+                        "Enviar instruções de acesso",
+                        "Comemorar! 🎉",
+                    ]},
+                ],
+            },
+        ],
+        'closing': {
+            'title': "✅ CHECKLIST COMPLETO!",
+            'body': """
+    Se você marcou todos os itens, seu app está 100% configurado e pronto para receber alunos!
+    """,
+            'tip': "Guarde este checklist - ele serve para todos os seus próximos apps também!",
+        },
+    },
+}
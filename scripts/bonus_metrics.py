@@ -0,0 +1,185 @@
+"""
+Métricas de renderização dos PDFs de bônus - TribeBuild
+
+Cada PDF gerado produz um registro (documento, páginas, bytes, tempo de
+layout, tempo de gravação, hits/misses dos caches de imagens e de quebra de
+linhas e worker). O MetricsRecorder grava os registros em JSON lines ou
+agrega tudo no formato texto do Prometheus (arquivo para o textfile
+collector do node_exporter ou endpoint /metrics local).
+
+Os workers só devolvem os registros; quem grava é sempre o processo
+principal, então não há escrita concorrente no arquivo.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FORMATS = ('jsonl', 'prom')
+
+# Limites (segundos) dos histogramas de tempo de layout e de gravação
+SECONDS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Intervalo mínimo entre regravações do arquivo .prom
+PROM_FLUSH_INTERVAL = 1.0
+
+
+class Histogram:
+    def __init__(self, buckets=SECONDS_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels.items()) + '}'
+
+
+class MetricsRecorder:
+    """
+    Recebe os registros de cada renderização.
+
+    path: arquivo de saída (opcional); fmt: 'jsonl' (um registro por linha)
+    ou 'prom' (arquivo reescrito com os agregados). Os agregados ficam
+    sempre disponíveis em prometheus_text(), usados pelo endpoint /metrics.
+    """
+
+    def __init__(self, path=None, fmt='jsonl'):
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato de métricas não suportado: {fmt} (disponíveis: {', '.join(FORMATS)})")
+        self.path = path
+        self.fmt = fmt
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8') if path and fmt == 'jsonl' else None
+        self._last_flush = 0.0
+        self._server = None
+
+        self.renders = defaultdict(int)
+        self.pages = defaultdict(int)
+        self.bytes = defaultdict(int)
+        self.layout = defaultdict(Histogram)
+        self.write = defaultdict(Histogram)
+        self.worker_renders = defaultdict(int)
+        self.cache = defaultdict(int)
+
+    def record(self, metrics):
+        with self._lock:
+            key = (metrics['document'], metrics['locale'])
+            self.renders[key] += 1
+            self.pages[key] += metrics['pages']
+            self.bytes[key] += metrics['bytes']
+            self.layout[key].observe(metrics['layout_seconds'])
+            self.write[key].observe(metrics['write_seconds'])
+            # Índice do worker no pool (estável); o pid muda a cada reciclagem e fica só no JSONL
+            slot = metrics.get('worker_slot')
+            self.worker_renders['main' if slot is None else str(slot)] += 1
+            self.cache['image', 'hit'] += metrics['cache_hits']
+            self.cache['image', 'miss'] += metrics['cache_misses']
+            self.cache['wrap', 'hit'] += metrics.get('wrap_hits', 0)
+            self.cache['wrap', 'miss'] += metrics.get('wrap_misses', 0)
+
+            if self._file:
+                self._file.write(json.dumps(metrics, ensure_ascii=False) + '\n')
+                self._file.flush()
+        if self.path and self.fmt == 'prom' and time.monotonic() - self._last_flush >= PROM_FLUSH_INTERVAL:
+            self.flush()
+
+    def prometheus_text(self):
+        with self._lock:
+            lines = []
+
+            def counter(name, help_text, values):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (document, locale), value in sorted(values.items()):
+                    lines.append(f"{name}{_labels(document=document, locale=locale)} {value}")
+
+            def histogram(name, help_text, values):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (document, locale), hist in sorted(values.items()):
+                    for bound, count in zip(hist.buckets, hist.counts):
+                        lines.append(f"{name}_bucket{_labels(document=document, locale=locale, le=bound)} {count}")
+                    lines.append(f"{name}_bucket{_labels(document=document, locale=locale, le='+Inf')} {hist.count}")
+                    lines.append(f"{name}_sum{_labels(document=document, locale=locale)} {hist.sum:.6f}")
+                    lines.append(f"{name}_count{_labels(document=document, locale=locale)} {hist.count}")
+
+            counter('bonus_pdf_renders_total', "PDFs gerados", self.renders)
+            counter('bonus_pdf_pages_total', "Páginas geradas", self.pages)
+            counter('bonus_pdf_bytes_total', "Bytes gravados", self.bytes)
+            histogram('bonus_pdf_layout_seconds', "Tempo de layout por PDF", self.layout)
+            histogram('bonus_pdf_write_seconds', "Tempo de gravação por PDF", self.write)
+
+            lines.append("# HELP bonus_pdf_cache_total Consultas aos caches de imagens e de quebra de linhas")
+            lines.append("# TYPE bonus_pdf_cache_total counter")
+            for (cache, result), value in sorted(self.cache.items()):
+                lines.append(f"bonus_pdf_cache_total{_labels(cache=cache, result=result)} {value}")
+
+            lines.append("# HELP bonus_pdf_worker_renders_total PDFs gerados por worker (índice no pool)")
+            lines.append("# TYPE bonus_pdf_worker_renders_total counter")
+            for worker, value in sorted(self.worker_renders.items()):
+                lines.append(f"bonus_pdf_worker_renders_total{_labels(worker=worker)} {value}")
+            return '\n'.join(lines) + '\n'
+
+    def flush(self):
+        """Reescreve o arquivo .prom de forma atômica (o collector nunca lê pela metade)"""
+        if not (self.path and self.fmt == 'prom'):
+            return
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp, self.path)
+        self._last_flush = time.monotonic()
+
+    def serve(self, port, host='127.0.0.1'):
+        """Expõe os agregados em http://host:port/metrics numa thread em segundo plano"""
+        recorder = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = recorder.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address
+
+    def close(self):
+        self.flush()
+        if self._file:
+            self._file.close()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def add_arguments(parser, serve=False):
+    """Opções de métricas compartilhadas pelos scripts de geração"""
+    parser.add_argument('--metrics', default=None,
+                        help="Arquivo de métricas (JSON lines ou texto do Prometheus)")
+    parser.add_argument('--metrics-format', choices=FORMATS, default='jsonl',
+                        help="Formato do arquivo de métricas (padrão: jsonl)")
+    if serve:
+        parser.add_argument('--metrics-port', type=int, default=None,
+                            help="Expõe /metrics em 127.0.0.1:<porta> enquanto roda")
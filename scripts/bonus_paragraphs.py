@@ -0,0 +1,163 @@
+"""
+Parágrafos com quebra de linhas em cache - TribeBuild
+
+A quebra de linhas justificada (TA_JUSTIFY) é a parte mais cara do layout,
+e os mesmos parágrafos são quebrados na mesma largura de frame em todo
+documento, locale e variante por aluno. Este Paragraph guarda o resultado
+do parse e da quebra de linhas por (markup, estilo, largura), então só os
+parágrafos cujo texto mudou (ex: o nome do aluno na capa) são quebrados de
+novo. O cache é por processo e limitado (LRU); o que foi montado antes do
+fork dos workers fica numa camada compartilhada (freeze_cache), da qual
+cada worker copia para o próprio LRU as entradas que usa.
+
+No modo acessível (canv.structure, ver bonus_accessibility) cada parágrafo
+vira um elemento da árvore de estrutura no momento em que é desenhado.
+"""
+
+from collections import OrderedDict
+from copy import deepcopy
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph as _Paragraph
+from reportlab.rl_config import _FUZZ
+
+from bonus_accessibility import printable
+
+CACHE_SIZE = 4096
+_parsed = OrderedDict()   # (markup, estilo, bullet) -> (texto, estilo, frags, bullet)
+_wrapped = OrderedDict()  # (markup, estilo, bullet, largura) -> (blPara, larguras, altura, frags)
+_shared_parsed = {}
+_shared_wrapped = {}
+_style_keys = {}
+WRAP_STATS = {'hits': 0, 'misses': 0}
+
+# Tag da árvore de estrutura por estilo (os demais viram P)
+STYLE_TAGS = {'MainTitle': 'H1', 'H1': 'H1', 'H2': 'H2', 'H3': 'H3'}
+
+
+def _copy_entry(value):
+    """Cópia de uma entrada do cache; os estilos só são lidos e continuam os mesmos objetos"""
+    return deepcopy(value, {id(item): item for item in value if isinstance(item, ParagraphStyle)})
+
+
+def _cache_get(cache, shared, key):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+        return value
+    value = shared.get(key)
+    if value is not None:
+        # As entradas compartilhadas nunca vão para um parágrafo: o worker usa uma cópia só dele
+        value = _copy_entry(value)
+        _cache_put(cache, key, value)
+    return value
+
+
+def _cache_put(cache, key, value):
+    cache[key] = value
+    if len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def freeze_cache():
+    """
+    Passa o conteúdo dos LRUs para a camada compartilhada. Chamado no
+    processo principal antes do fork. A camada guarda cópias que nenhum
+    parágrafo referencia e nunca as entrega: o ReportLab altera linhas e
+    frags (ex: no split), então cada worker copia a entrada para o próprio
+    LRU no primeiro uso e as páginas herdadas ficam como estavam.
+    """
+    _shared_parsed.update((key, _copy_entry(value)) for key, value in _parsed.items())
+    _shared_wrapped.update((key, _copy_entry(value)) for key, value in _wrapped.items())
+    _parsed.clear()
+    _wrapped.clear()
+
+
+def style_key(style):
+    """
+    Identifica o estilo pelos valores dos atributos, lidos só no primeiro uso:
+    não altere um estilo depois de usá-lo (crie outro), ou o cache não percebe.
+    """
+    entry = _style_keys.get(id(style))
+    if entry is None:
+        # Guardamos o próprio estilo para o id não ser reaproveitado por outro objeto
+        key = repr(sorted((name, value) for name, value in vars(style).items() if name != 'parent'))
+        entry = _style_keys[id(style)] = (style, key)
+    return entry[1]
+
+
+class Paragraph(_Paragraph):
+    """
+    Paragraph do ReportLab com parse e quebra de linhas em cache.
+
+    Os resultados em cache são compartilhados entre instâncias e nunca são
+    alterados: o ReportLab modifica as linhas ao desenhar texto RTL, que por
+    isso não usa o cache, e as palavras e frags ao dividir o parágrafo entre
+    páginas, o que split faz numa cópia. Pedaços de parágrafos divididos
+    (criados sem markup) seguem o caminho normal.
+
+    tag: tag da árvore de estrutura (padrão: pelo estilo, ver STYLE_TAGS);
+    list_item: o parágrafo é um item de lista (L/LI/LBody).
+    """
+
+    def __init__(self, text, style=None, *args, tag=None, list_item=False, **kwargs):
+        self.tag = tag or STYLE_TAGS.get(getattr(style, 'name', None), 'P')
+        self.list_item = list_item
+        self._struct = [None]  # elemento da árvore, compartilhado com os pedaços após um split
+        _Paragraph.__init__(self, text, style, *args, **kwargs)
+
+    def _setup(self, text, style, bulletText, frags, cleaner):
+        self._cache_key = None
+        if text is None or frags is not None or getattr(style, 'wordWrap', None) == 'RTL':
+            return _Paragraph._setup(self, text, style, bulletText, frags, cleaner)
+
+        self._cache_key = (text, style_key(style), bulletText)
+        parsed = _cache_get(_parsed, _shared_parsed, self._cache_key)
+        if parsed is None:
+            _Paragraph._setup(self, text, style, bulletText, frags, cleaner)
+            # Fontes TrueType (modo acessível) não têm os emojis
+            for frag in self.frags:
+                if getattr(frag, 'text', None):
+                    frag.text = printable(frag.text, frag.fontName)
+            _cache_put(_parsed, self._cache_key, (self.text, self.style, self.frags, self.bulletText))
+        else:
+            text, parsed_style, frags, bulletText = parsed
+            _Paragraph._setup(self, text, parsed_style, bulletText, frags, cleaner)
+
+    def wrap(self, availWidth, availHeight):
+        if self._cache_key is None or availWidth < _FUZZ:
+            return _Paragraph.wrap(self, availWidth, availHeight)
+
+        key = self._cache_key + (availWidth,)
+        wrapped = _cache_get(_wrapped, _shared_wrapped, key)
+        if wrapped is None:
+            WRAP_STATS['misses'] += 1
+            width, height = _Paragraph.wrap(self, availWidth, availHeight)
+            # A quebra de linhas troca self.frags pelas palavras processadas, a que as linhas se referem
+            _cache_put(_wrapped, key, (self.blPara, self._wrapWidths, height, self.frags))
+            return width, height
+
+        WRAP_STATS['hits'] += 1
+        self.width = availWidth
+        self.blPara, self._wrapWidths, self.height, self.frags = wrapped
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        if self._cache_key is not None and availWidth >= _FUZZ and availHeight >= _FUZZ:
+            if not hasattr(self, 'blPara'):
+                self.wrap(availWidth, availHeight)
+            # Linhas e frags juntos: as linhas apontam para as palavras dos frags
+            self.blPara, self.frags = deepcopy((self.blPara, self.frags))
+        parts = _Paragraph.split(self, availWidth, availHeight)
+        for part in parts:
+            part.tag, part.list_item, part._struct = self.tag, self.list_item, self._struct
+        return parts
+
+    def drawOn(self, canv, x, y, _sW=0):
+        tree = getattr(canv, 'structure', None)
+        if tree is None:
+            return _Paragraph.drawOn(self, canv, x, y, _sW)
+        if self._struct[0] is None:
+            self._struct[0] = tree.element(self.tag, list_item=self.list_item)
+        with tree.marked(canv, self._struct[0]):
+            _Paragraph.drawOn(self, canv, x, y, _sW)
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Regeneração em massa dos PDFs de bônus personalizados - TribeBuild
+
+Lê a lista de alunos (CSV ou JSONL com id, name e opcionalmente locale e
+logo_url), divide em shards e processa os shards em paralelo. Cada shard
+concluído é gravado no journal de checkpoint, então uma execução
+interrompida continua de onde parou quando rodada de novo. Alunos que
+falharam ficam registrados no journal e são gerados de novo na próxima
+execução. Quando todos os alunos são gerados sem falha, o journal é
+arquivado (.done) e a próxima execução começa do zero.
+
+Uso: python scripts/rebuild_bonus_pdfs.py alunos.csv --output-dir /tmp/bonus
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+
+import bonus_metrics
+from bonus_locales import DEFAULT_LOCALE, LOCALES
+from create_bonus_pdfs import DOCUMENTS, create_pool, write_document
+
+# Alunos por shard (unidade de checkpoint)
+DEFAULT_SHARD_SIZE = 200
+
+# Shards processados por worker (em média) antes de o pool ser reciclado (limita a memória)
+DEFAULT_SHARDS_PER_WORKER = 20
+
+JOURNAL_NAME = '.rebuild-journal.jsonl'
+
+
+def read_students(path):
+    """Lê os alunos do CSV ou JSONL, um por vez"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_shards(path, shard_size):
+    """Gera (índice, alunos) sem carregar a lista inteira na memória"""
+    students = read_students(path)
+    index = 0
+    while True:
+        shard = list(islice(students, shard_size))
+        if not shard:
+            return
+        yield index, shard
+        index += 1
+
+
+def student_dir(output_dir, student_id):
+    """Diretório do aluno (id higienizado para uso como nome de pasta)"""
+    return os.path.join(output_dir, re.sub(r'[^A-Za-z0-9_.-]', '_', str(student_id)))
+
+
+def render_shard(index, students, output_dir, documents, default_locale, default_logo, accessible=False):
+    """
+    Gera todos os documentos de um shard (executa no worker).
+
+    Cada PDF é gravado em um arquivo temporário e renomeado no final, então
+    uma interrupção nunca deixa um PDF pela metade.
+    """
+    rendered = 0
+    failed = []
+    metrics = []
+    for student in students:
+        try:
+            locale = student.get('locale') or default_locale
+            logo = student.get('logo_url') or default_logo
+            target_dir = student_dir(output_dir, student['id'])
+            os.makedirs(target_dir, exist_ok=True)
+            for doc_id in documents:
+                path = os.path.join(target_dir, DOCUMENTS[doc_id][0])
+                metrics.append(write_document(path + '.tmp', doc_id, locale, logo, student, accessible))
+                os.replace(path + '.tmp', path)
+                rendered += 1
+        except Exception as e:
+            failed.append({'id': student.get('id'), 'error': f"{type(e).__name__}: {e}"})
+    return {'shard': index, 'students': len(students), 'rendered': rendered, 'failed': failed, 'metrics': metrics}
+
+
+class Journal:
+    """
+    Journal de checkpoint (JSON lines). A primeira linha identifica a entrada
+    e o tamanho do shard; cada linha seguinte registra um shard processado,
+    com os alunos que falharam.
+
+    done guarda os shards concluídos sem falhas; failed, os alunos com falha
+    de cada shard (a linha mais recente do shard vale). Esses alunos são
+    gerados de novo ao retomar (ver pending).
+    """
+
+    def __init__(self, path, header):
+        self.path = path
+        self.header = header
+        self.done = {}
+        self.failed = {}
+        if os.path.exists(path):
+            lines = self._read()
+            if lines and lines[0] != header:
+                raise ValueError(
+                    f"O journal {path} é de outra entrada, outro tamanho de shard ou outras opções "
+                    "(documentos, locale, logo, modo acessível). "
+                    "Use --restart para começar do zero."
+                )
+            for entry in lines[1:]:
+                self._apply(entry)
+        self._file = open(path, 'a', encoding='utf-8')
+        if os.path.getsize(path) == 0:
+            self._write(header)
+
+    def _read(self):
+        """
+        Entradas gravadas. Se o processo morreu no meio de uma gravação, a
+        última linha fica pela metade: ela é descartada e cortada do arquivo,
+        para a próxima entrada começar em uma linha nova.
+        """
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        # Toda entrada termina com '\n'; o que vem depois do último é gravação interrompida
+        complete = data[:data.rfind(b'\n') + 1]
+        lines = complete.split(b'\n')[:-1]
+        entries = []
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                if number < len(lines):
+                    raise ValueError(
+                        f"O journal {self.path} está corrompido na linha {number}. "
+                        "Use --restart para começar do zero."
+                    )
+                complete = complete[:-len(line) - 1]
+        if len(complete) < len(data):
+            with open(self.path, 'r+b') as f:
+                f.truncate(len(complete))
+        return entries
+
+    def _apply(self, entry):
+        shard = entry['shard']
+        if entry['failed']:
+            self.failed[shard] = entry['failed']
+        else:
+            self.done[shard] = entry
+            self.failed.pop(shard, None)
+
+    def pending(self, index, students):
+        """Alunos do shard que ainda precisam ser gerados (todos, só os que falharam ou nenhum)"""
+        if index in self.done:
+            return []
+        if index in self.failed:
+            ids = {str(entry['id']) for entry in self.failed[index]}
+            return [student for student in students if str(student.get('id')) in ids]
+        return students
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def record(self, result):
+        self._apply(result)
+        self._write(result)
+
+    def close(self):
+        self._file.close()
+
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class Progress:
+    """Registra cada shard no journal e mostra vazão e ETA desta execução"""
+
+    def __init__(self, journal, total_shards, pending_students, recorder=None):
+        self.journal = journal
+        self.recorder = recorder
+        self.total_shards = total_shards
+        self.pending_students = pending_students
+        self.started = time.monotonic()
+        self.students = 0
+        self.rendered = 0
+        # Falhas de execuções anteriores são tentadas de novo; contam só as desta execução
+        self.failed = 0
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def update(self, result):
+        metrics = result.pop('metrics')
+        if self.recorder:
+            for entry in metrics:
+                self.recorder.record(entry)
+        self.journal.record(result)
+        self.students += result['students']
+        self.rendered += result['rendered']
+        self.failed += len(result['failed'])
+
+        elapsed = self.elapsed
+        rate = self.rendered / elapsed if elapsed else 0
+        eta = (self.pending_students - self.students) * elapsed / self.students if self.students else 0
+        failed = f" - {len(result['failed'])} falhas" if result['failed'] else ""
+        processed = len(self.journal.done) + len(self.journal.failed)
+        print(f"📦 shard {result['shard']} ok ({processed}/{self.total_shards}){failed} | "
+              f"{self.students}/{self.pending_students} alunos | {rate:.1f} PDFs/s | ETA {format_duration(eta)}")
+
+
+def rebuild(input_path, output_dir, documents=tuple(DOCUMENTS), locale=DEFAULT_LOCALE, logo=None,
+            jobs=None, shard_size=DEFAULT_SHARD_SIZE, shards_per_worker=DEFAULT_SHARDS_PER_WORKER,
+            journal_path=None, restart=False, recorder=None, accessible=False, prefork=False):
+    """
+    Regenera os PDFs de todos os alunos; retorna o número de alunos com falha.
+    As métricas de cada PDF vão para recorder (MetricsRecorder), se houver;
+    accessible gera os PDFs no modo tagged PDF + PDF/A; prefork: workers
+    pré-fork (ver create_bonus_pdfs.create_pool), usado pela linha de comando.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    journal_path = journal_path or os.path.join(output_dir, JOURNAL_NAME)
+    if restart and os.path.exists(journal_path):
+        os.remove(journal_path)
+
+    header = {
+        'input': os.path.abspath(input_path),
+        'sha256': file_digest(input_path),
+        'shard_size': shard_size,
+        'documents': list(documents),
+        'accessible': accessible,
+        'locale': locale,
+        'logo': logo,
+    }
+    journal = Journal(journal_path, header)
+
+    total_shards = pending_shards = pending_students = 0
+    for index, students in iter_shards(input_path, shard_size):
+        pending = len(journal.pending(index, students))
+        total_shards += 1
+        pending_shards += bool(pending)
+        pending_students += pending
+    if journal.done or journal.failed:
+        retry = sum(len(failed) for failed in journal.failed.values())
+        print(f"↩️  Retomando: {len(journal.done)}/{total_shards} shards já concluídos"
+              + (f", {retry} alunos com falha para gerar de novo" if retry else ""))
+    print(f"🚀 {pending_students} alunos em {pending_shards} shards ({len(documents)} PDFs por aluno)")
+
+    jobs = jobs or os.cpu_count() or 1
+    progress = Progress(journal, total_shards, pending_students, recorder)
+    shards = ((index, pending) for index, students in iter_shards(input_path, shard_size)
+              for pending in [journal.pending(index, students)] if pending)
+
+    in_flight = set()
+
+    def collect(until):
+        nonlocal in_flight
+        while len(in_flight) > until:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                progress.update(future.result())
+
+    # Workers pré-fork: estilos, fontes e os documentos de cada locale são
+    # preparados uma vez aqui e compartilhados com os workers (copy-on-write).
+    # A cada jobs * shards_per_worker shards o pool é esvaziado e recriado,
+    # para a memória própria dos workers não crescer. Com o /metrics rodando
+    # numa thread (--metrics-port) o fork não é seguro e create_pool usa spawn.
+    pool = None
+    submitted = 0
+    try:
+        for index, students in shards:
+            if pool is None or submitted >= jobs * shards_per_worker:
+                if pool:
+                    collect(0)
+                    pool.shutdown()
+                pool = create_pool(jobs, accessible, tuple(LOCALES), documents, logo, prefork)
+                submitted = 0
+            in_flight.add(pool.submit(render_shard, index, students, output_dir, documents, locale, logo,
+                                       accessible))
+            submitted += 1
+            # No máximo 2 shards por worker em espera: o processo principal não carrega a entrada inteira
+            collect(jobs * 2 - 1)
+        collect(0)
+    except KeyboardInterrupt:
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+        print("\n⏸️  Interrompido - rode o mesmo comando para continuar do último checkpoint")
+        raise
+    finally:
+        if pool:
+            pool.shutdown()
+        journal.close()
+
+    if not journal.failed:
+        # Tudo gerado: o checkpoint não serve mais e rodar de novo regenera tudo
+        os.replace(journal_path, journal_path + '.done')
+
+    print(f"\n✅ {progress.rendered} PDFs gerados em {format_duration(progress.elapsed)}"
+          + (f" - ⚠️  {progress.failed} alunos com falha (veja {journal_path})" if progress.failed else ""))
+    return progress.failed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Regenera os PDFs de bônus personalizados de todos os alunos")
+    parser.add_argument('input', help="Alunos em CSV ou JSONL (id, name, locale, logo_url)")
+    parser.add_argument('--output-dir', required=True, help="Diretório de saída (um subdiretório por aluno)")
+    parser.add_argument('--documents', default=','.join(DOCUMENTS),
+                        help=f"Documentos separados por vírgula (padrão: {','.join(DOCUMENTS)})")
+    parser.add_argument('--locale', default=DEFAULT_LOCALE,
+                        help="Locale dos alunos sem a coluna locale")
+    parser.add_argument('--logo', default=None, help="Logo padrão para alunos sem logo_url")
+    parser.add_argument('--jobs', type=int, default=None, help="Processos em paralelo (padrão: nº de CPUs)")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, help="Alunos por shard")
+    parser.add_argument('--shards-per-worker', type=int, default=DEFAULT_SHARDS_PER_WORKER,
+                        help="Shards por worker antes de reciclar os processos")
+    parser.add_argument('--journal', default=None,
+                        help=f"Arquivo de checkpoint (padrão: <output-dir>/{JOURNAL_NAME})")
+    parser.add_argument('--restart', action='store_true', help="Ignora o checkpoint e começa do zero")
+    parser.add_argument('--accessible', action='store_true',
+                        help="Gera tagged PDF / PDF/A-2b (leitores de tela e arquivamento)")
+    bonus_metrics.add_arguments(parser, serve=True)
+    args = parser.parse_args(argv)
+
+    args.documents = [doc_id.strip() for doc_id in args.documents.split(',') if doc_id.strip()]
+    unknown = [doc_id for doc_id in args.documents if doc_id not in DOCUMENTS]
+    if unknown:
+        parser.error(f"documento desconhecido: {', '.join(unknown)}")
+    if args.locale not in LOCALES:
+        parser.error(f"locale não suportado: {args.locale}")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    recorder = None
+    if args.metrics or args.metrics_port:
+        recorder = bonus_metrics.MetricsRecorder(args.metrics, args.metrics_format)
+    if args.metrics_port:
+        host, port = recorder.serve(args.metrics_port)
+        print(f"📈 Métricas em http://{host}:{port}/metrics")
+    try:
+        failed = rebuild(args.input, args.output_dir, args.documents, args.locale, args.logo, args.jobs,
+                         args.shard_size, args.shards_per_worker, args.journal, args.restart, recorder,
+                         args.accessible, prefork=True)
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        if recorder:
+            recorder.close()
+    sys.exit(1 if failed else 0)